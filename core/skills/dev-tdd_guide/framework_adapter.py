@@ -7,6 +7,8 @@ Handles framework-specific patterns, imports, and test structure.
 
 from typing import Dict, List, Any, Optional
 from enum import Enum
+from functools import lru_cache
+import re
 
 
 class Framework(Enum):
@@ -21,6 +23,10 @@ class Framework(Enum):
     JASMINE = "jasmine"
 
 
+_JS_FRAMEWORKS = frozenset({Framework.JEST, Framework.VITEST, Framework.MOCHA})
+_JVM_FRAMEWORKS = frozenset({Framework.JUNIT, Framework.TESTNG})
+
+
 class Language(Enum):
     """Supported programming languages."""
     TYPESCRIPT = "typescript"
@@ -29,9 +35,108 @@ class Language(Enum):
     JAVA = "java"
 
 
+# Detection rules in priority order: a framework matches when every marker
+# of any one of its marker groups occurs in the code.
+_DETECTION_RULES = (
+    (Framework.JEST, (("@jest/",),)),
+    (Framework.VITEST, (("from 'vitest'",), ("import { vi }",))),
+    # 'import pytest' alone, or a pytest.fixture together with a test function
+    (Framework.PYTEST, (("import pytest",), ("pytest.fixture", "def test_"))),
+    (Framework.UNITTEST, (("import unittest", "unittest.TestCase"),)),
+    (Framework.JUNIT, (("@Test", "import org.junit"),)),
+    (Framework.TESTNG, (("@Test", "import org.testng"),)),
+    (Framework.MOCHA, (("from 'mocha'",), ("describe(", "from 'chai'"))),
+)
+
+# Every marker group above contains at least one of these, so code without
+# any of them cannot match and skips the full marker scan.
+_DETECTION_ANCHORS = ('@', 'import', "from '", 'pytest')
+
+
+@lru_cache(maxsize=None)
+def _detection_pattern() -> re.Pattern:
+    """
+    Compile the framework-marker pattern on first use.
+
+    One lookahead alternation over every marker, so the code is scanned
+    once; the zero-width match lets overlapping markers all be reported.
+    Compiled lazily because only detect_framework needs it.
+    """
+    markers = dict.fromkeys(
+        marker
+        for _, groups in _DETECTION_RULES
+        for group in groups
+        for marker in group
+    )
+    return re.compile('(?=(%s))' % '|'.join(map(re.escape, markers)))
+
+
+_WORD_RE = re.compile(r'[^\s_-]+')
+
+
+@lru_cache(maxsize=4096)
+def _to_camel_case(text: str) -> str:
+    """Convert text to camelCase."""
+    words = _WORD_RE.findall(text)
+    if not words:
+        return text
+    return words[0].lower() + ''.join(word.capitalize() for word in words[1:])
+
+
+@lru_cache(maxsize=4096)
+def _to_class_name(text: str) -> str:
+    """Convert text to ClassName."""
+    return ''.join(word.capitalize() for word in _WORD_RE.findall(text))
+
+
+def _to_snake_name(text: str) -> str:
+    """Convert spaces and hyphens in text to underscores."""
+    return text.replace(' ', '_').replace('-', '_')
+
+
+_JS_TEST_TEMPLATE = """it('{name}', () => {{
+  // {desc}
+{body}
+}});"""
+
+_PYTHON_TEST_TEMPLATE = """def test_{name}(self):
+    \"\"\"
+    {desc}
+    \"\"\"
+{body}"""
+
+_JAVA_TEST_TEMPLATE = """@Test
+public void test{name}() {{
+    // {desc}
+{body}
+}}"""
+
+
 class FrameworkAdapter:
     """Adapter for multiple testing frameworks."""
 
+    _IMPORTS = {
+        Framework.JEST: """import { describe, it, expect, beforeEach, afterEach } from '@jest/globals';""",
+        Framework.VITEST: """import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';""",
+        Framework.PYTEST: """import pytest""",
+        Framework.UNITTEST: """import unittest""",
+        Framework.JUNIT: """import org.junit.jupiter.api.Test;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.AfterEach;
+import static org.junit.jupiter.api.Assertions.*;""",
+        Framework.TESTNG: """import org.testng.annotations.Test;
+import org.testng.annotations.BeforeMethod;
+import org.testng.annotations.AfterMethod;
+import static org.testng.Assert.*;""",
+        Framework.MOCHA: """import { describe, it, beforeEach, afterEach } from 'mocha';
+import { expect } from 'chai';""",
+    }
+
+    _LIFECYCLE_ANNOTATIONS = {
+        Framework.JUNIT: ("@BeforeEach", "@AfterEach"),
+        Framework.TESTNG: ("@BeforeMethod", "@AfterMethod"),
+    }
+
     def __init__(self, framework: Framework, language: Language):
         """
         Initialize framework adapter.
@@ -42,60 +147,14 @@ class FrameworkAdapter:
         """
         self.framework = framework
         self.language = language
+        self._imports = self._IMPORTS.get(framework, "")
+        self._setup_annotation, self._teardown_annotation = (
+            self._LIFECYCLE_ANNOTATIONS.get(framework, ("", ""))
+        )
 
     def generate_imports(self) -> str:
         """Generate framework-specific imports."""
-        if self.framework == Framework.JEST:
-            return self._jest_imports()
-        elif self.framework == Framework.VITEST:
-            return self._vitest_imports()
-        elif self.framework == Framework.PYTEST:
-            return self._pytest_imports()
-        elif self.framework == Framework.UNITTEST:
-            return self._unittest_imports()
-        elif self.framework == Framework.JUNIT:
-            return self._junit_imports()
-        elif self.framework == Framework.TESTNG:
-            return self._testng_imports()
-        elif self.framework == Framework.MOCHA:
-            return self._mocha_imports()
-        else:
-            return ""
-
-    def _jest_imports(self) -> str:
-        """Generate Jest imports."""
-        return """import { describe, it, expect, beforeEach, afterEach } from '@jest/globals';"""
-
-    def _vitest_imports(self) -> str:
-        """Generate Vitest imports."""
-        return """import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';"""
-
-    def _pytest_imports(self) -> str:
-        """Generate Pytest imports."""
-        return """import pytest"""
-
-    def _unittest_imports(self) -> str:
-        """Generate unittest imports."""
-        return """import unittest"""
-
-    def _junit_imports(self) -> str:
-        """Generate JUnit imports."""
-        return """import org.junit.jupiter.api.Test;
-import org.junit.jupiter.api.BeforeEach;
-import org.junit.jupiter.api.AfterEach;
-import static org.junit.jupiter.api.Assertions.*;"""
-
-    def _testng_imports(self) -> str:
-        """Generate TestNG imports."""
-        return """import org.testng.annotations.Test;
-import org.testng.annotations.BeforeMethod;
-import org.testng.annotations.AfterMethod;
-import static org.testng.Assert.*;"""
-
-    def _mocha_imports(self) -> str:
-        """Generate Mocha imports."""
-        return """import { describe, it, beforeEach, afterEach } from 'mocha';
-import { expect } from 'chai';"""
+        return self._imports
 
     def generate_test_suite_wrapper(
         self,
@@ -112,30 +171,47 @@ import { expect } from 'chai';"""
         Returns:
             Complete test suite code
         """
-        if self.framework in [Framework.JEST, Framework.VITEST, Framework.MOCHA]:
-            return f"""describe('{suite_name}', () => {{
+        wrapper = self._SUITE_DISPATCH.get(self.framework)
+        if wrapper is None:
+            return test_content
+        return wrapper(self, suite_name, test_content)
+
+    def _js_suite(self, suite_name: str, test_content: str) -> str:
+        """Generate describe block for Jest, Vitest and Mocha."""
+        return f"""describe('{suite_name}', () => {{
 {self._indent(test_content, 2)}
 }});"""
 
-        elif self.framework == Framework.PYTEST:
-            return f"""class Test{self._to_class_name(suite_name)}:
+    def _pytest_suite(self, suite_name: str, test_content: str) -> str:
+        """Generate Pytest test class."""
+        return f"""class Test{_to_class_name(suite_name)}:
     \"\"\"Test suite for {suite_name}.\"\"\"
 
 {self._indent(test_content, 4)}"""
 
-        elif self.framework == Framework.UNITTEST:
-            return f"""class Test{self._to_class_name(suite_name)}(unittest.TestCase):
+    def _unittest_suite(self, suite_name: str, test_content: str) -> str:
+        """Generate unittest TestCase class."""
+        return f"""class Test{_to_class_name(suite_name)}(unittest.TestCase):
     \"\"\"Test suite for {suite_name}.\"\"\"
 
 {self._indent(test_content, 4)}"""
 
-        elif self.framework in [Framework.JUNIT, Framework.TESTNG]:
-            return f"""public class {self._to_class_name(suite_name)}Test {{
+    def _java_suite(self, suite_name: str, test_content: str) -> str:
+        """Generate JUnit/TestNG test class."""
+        return f"""public class {_to_class_name(suite_name)}Test {{
 
 {self._indent(test_content, 4)}
 }}"""
 
-        return test_content
+    _SUITE_DISPATCH = {
+        Framework.JEST: _js_suite,
+        Framework.VITEST: _js_suite,
+        Framework.MOCHA: _js_suite,
+        Framework.PYTEST: _pytest_suite,
+        Framework.UNITTEST: _unittest_suite,
+        Framework.JUNIT: _java_suite,
+        Framework.TESTNG: _java_suite,
+    }
 
     def generate_test_function(
         self,
@@ -154,79 +230,28 @@ import { expect } from 'chai';"""
         Returns:
             Complete test function
         """
-        if self.framework == Framework.JEST:
-            return self._jest_test(test_name, test_body, description)
-        elif self.framework == Framework.VITEST:
-            return self._vitest_test(test_name, test_body, description)
-        elif self.framework == Framework.PYTEST:
-            return self._pytest_test(test_name, test_body, description)
-        elif self.framework == Framework.UNITTEST:
-            return self._unittest_test(test_name, test_body, description)
-        elif self.framework == Framework.JUNIT:
-            return self._junit_test(test_name, test_body, description)
-        elif self.framework == Framework.TESTNG:
-            return self._testng_test(test_name, test_body, description)
-        elif self.framework == Framework.MOCHA:
-            return self._mocha_test(test_name, test_body, description)
-        else:
+        spec = self._TEST_TEMPLATES.get(self.framework)
+        if spec is None:
             return ""
 
-    def _jest_test(self, test_name: str, test_body: str, description: str) -> str:
-        """Generate Jest test."""
-        return f"""it('{test_name}', () => {{
-  // {description}
-{self._indent(test_body, 2)}
-}});"""
-
-    def _vitest_test(self, test_name: str, test_body: str, description: str) -> str:
-        """Generate Vitest test."""
-        return f"""it('{test_name}', () => {{
-  // {description}
-{self._indent(test_body, 2)}
-}});"""
-
-    def _pytest_test(self, test_name: str, test_body: str, description: str) -> str:
-        """Generate Pytest test."""
-        func_name = test_name.replace(' ', '_').replace('-', '_')
-        return f"""def test_{func_name}(self):
-    \"\"\"
-    {description or test_name}
-    \"\"\"
-{self._indent(test_body, 4)}"""
-
-    def _unittest_test(self, test_name: str, test_body: str, description: str) -> str:
-        """Generate unittest test."""
-        func_name = self._to_camel_case(test_name)
-        return f"""def test_{func_name}(self):
-    \"\"\"
-    {description or test_name}
-    \"\"\"
-{self._indent(test_body, 4)}"""
-
-    def _junit_test(self, test_name: str, test_body: str, description: str) -> str:
-        """Generate JUnit test."""
-        method_name = self._to_camel_case(test_name)
-        return f"""@Test
-public void test{method_name}() {{
-    // {description}
-{self._indent(test_body, 4)}
-}}"""
-
-    def _testng_test(self, test_name: str, test_body: str, description: str) -> str:
-        """Generate TestNG test."""
-        method_name = self._to_camel_case(test_name)
-        return f"""@Test
-public void test{method_name}() {{
-    // {description}
-{self._indent(test_body, 4)}
-}}"""
-
-    def _mocha_test(self, test_name: str, test_body: str, description: str) -> str:
-        """Generate Mocha test."""
-        return f"""it('{test_name}', () => {{
-  // {description}
-{self._indent(test_body, 2)}
-}});"""
+        template, to_name, spaces, name_as_description = spec
+        return template.format_map({
+            'name': to_name(test_name),
+            'desc': (description or test_name) if name_as_description else description,
+            'body': self._indent(test_body, spaces),
+        })
+
+    # Framework -> (template, test name transform, body indent, fall back to
+    # the test name when no description is given)
+    _TEST_TEMPLATES = {
+        Framework.JEST: (_JS_TEST_TEMPLATE, str, 2, False),
+        Framework.VITEST: (_JS_TEST_TEMPLATE, str, 2, False),
+        Framework.MOCHA: (_JS_TEST_TEMPLATE, str, 2, False),
+        Framework.PYTEST: (_PYTHON_TEST_TEMPLATE, _to_snake_name, 4, True),
+        Framework.UNITTEST: (_PYTHON_TEST_TEMPLATE, _to_camel_case, 4, True),
+        Framework.JUNIT: (_JAVA_TEST_TEMPLATE, _to_camel_case, 4, False),
+        Framework.TESTNG: (_JAVA_TEST_TEMPLATE, _to_camel_case, 4, False),
+    }
 
     def generate_assertion(
         self,
@@ -245,16 +270,10 @@ public void test{method_name}() {{
         Returns:
             Assertion statement
         """
-        if self.framework in [Framework.JEST, Framework.VITEST]:
-            return self._jest_assertion(actual, expected, assertion_type)
-        elif self.framework in [Framework.PYTEST, Framework.UNITTEST]:
-            return self._python_assertion(actual, expected, assertion_type)
-        elif self.framework in [Framework.JUNIT, Framework.TESTNG]:
-            return self._java_assertion(actual, expected, assertion_type)
-        elif self.framework == Framework.MOCHA:
-            return self._chai_assertion(actual, expected, assertion_type)
-        else:
+        generator = self._ASSERTION_DISPATCH.get(self.framework)
+        if generator is None:
             return f"assert {actual} == {expected}"
+        return generator(self, actual, expected, assertion_type)
 
     def _jest_assertion(self, actual: str, expected: str, assertion_type: str) -> str:
         """Generate Jest assertion."""
@@ -316,6 +335,16 @@ public void test{method_name}() {{
         else:
             return f"expect({actual}).to.equal({expected});"
 
+    _ASSERTION_DISPATCH = {
+        Framework.JEST: _jest_assertion,
+        Framework.VITEST: _jest_assertion,
+        Framework.PYTEST: _python_assertion,
+        Framework.UNITTEST: _python_assertion,
+        Framework.JUNIT: _java_assertion,
+        Framework.TESTNG: _java_assertion,
+        Framework.MOCHA: _chai_assertion,
+    }
+
     def generate_setup_teardown(
         self,
         setup_code: str = "",
@@ -324,7 +353,7 @@ public void test{method_name}() {{
         """Generate setup and teardown hooks."""
         result = []
 
-        if self.framework in [Framework.JEST, Framework.VITEST, Framework.MOCHA]:
+        if self.framework in _JS_FRAMEWORKS:
             if setup_code:
                 result.append(f"""beforeEach(() => {{
 {self._indent(setup_code, 2)}
@@ -352,17 +381,15 @@ def setup_method(self):
                 result.append(f"""def tearDown(self):
 {self._indent(teardown_code, 4)}""")
 
-        elif self.framework in [Framework.JUNIT, Framework.TESTNG]:
-            annotation = "@BeforeEach" if self.framework == Framework.JUNIT else "@BeforeMethod"
+        elif self.framework in _JVM_FRAMEWORKS:
             if setup_code:
-                result.append(f"""{annotation}
+                result.append(f"""{self._setup_annotation}
 public void setUp() {{
 {self._indent(setup_code, 4)}
 }}""")
 
-            annotation = "@AfterEach" if self.framework == Framework.JUNIT else "@AfterMethod"
             if teardown_code:
-                result.append(f"""{annotation}
+                result.append(f"""{self._teardown_annotation}
 public void tearDown() {{
 {self._indent(teardown_code, 4)}
 }}""")
@@ -371,21 +398,10 @@ public void tearDown() {{
 
     def _indent(self, text: str, spaces: int) -> str:
         """Indent text by number of spaces."""
+        # Split on '\n' only: textwrap.indent would also break lines at '\r',
+        # form feeds and other str.splitlines boundaries
         indent = " " * spaces
-        lines = text.split('\n')
-        return '\n'.join(indent + line if line.strip() else line for line in lines)
-
-    def _to_camel_case(self, text: str) -> str:
-        """Convert text to camelCase."""
-        words = text.replace('-', ' ').replace('_', ' ').split()
-        if not words:
-            return text
-        return words[0].lower() + ''.join(word.capitalize() for word in words[1:])
-
-    def _to_class_name(self, text: str) -> str:
-        """Convert text to ClassName."""
-        words = text.replace('-', ' ').replace('_', ' ').split()
-        return ''.join(word.capitalize() for word in words)
+        return '\n'.join(indent + line if line.strip() else line for line in text.split('\n'))
 
     def detect_framework(self, code: str) -> Optional[Framework]:
         """
@@ -397,32 +413,15 @@ public void tearDown() {{
         Returns:
             Detected framework or None
         """
-        # Jest patterns
-        if 'from \'@jest/globals\'' in code or '@jest/' in code:
-            return Framework.JEST
-
-        # Vitest patterns
-        if 'from \'vitest\'' in code or 'import { vi }' in code:
-            return Framework.VITEST
-
-        # Pytest patterns
-        if 'import pytest' in code or 'def test_' in code and 'pytest.fixture' in code:
-            return Framework.PYTEST
-
-        # Unittest patterns
-        if 'import unittest' in code and 'unittest.TestCase' in code:
-            return Framework.UNITTEST
-
-        # JUnit patterns
-        if '@Test' in code and 'import org.junit' in code:
-            return Framework.JUNIT
+        if not any(anchor in code for anchor in _DETECTION_ANCHORS):
+            return None
 
-        # TestNG patterns
-        if '@Test' in code and 'import org.testng' in code:
-            return Framework.TESTNG
+        found = set(_detection_pattern().findall(code))
+        if not found:
+            return None
 
-        # Mocha patterns
-        if 'from \'mocha\'' in code or ('describe(' in code and 'from \'chai\'' in code):
-            return Framework.MOCHA
+        for framework, groups in _DETECTION_RULES:
+            if any(found.issuperset(group) for group in groups):
+                return framework
 
         return None
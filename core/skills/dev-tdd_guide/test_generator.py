@@ -5,17 +5,87 @@ Generates test cases from requirements, user stories, API specs, and code analys
 Supports multiple testing frameworks with intelligent test scaffolding.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Iterator, Optional, Tuple
 from enum import Enum
+from functools import lru_cache
+from itertools import chain
 
+from framework_adapter import Framework
 
-class TestFramework(Enum):
-    """Supported testing frameworks."""
-    JEST = "jest"
-    VITEST = "vitest"
-    PYTEST = "pytest"
-    JUNIT = "junit"
-    MOCHA = "mocha"
+# Test generation shares the adapter's framework enum
+TestFramework = Framework
+
+
+# Shared Arrange/Act/Assert bodies appended after each stub's header line
+_JS_STUB_BODY = """
+    // Arrange
+    // TODO: Set up test data and dependencies
+
+    // Act
+    // TODO: Execute the code under test
+
+    // Assert
+    // TODO: Verify expected behavior
+    expect(true).toBe(true); // Replace with actual assertion
+  });
+});"""
+
+_PYTHON_STUB_BODY = """
+    \"\"\"
+    # Arrange
+    # TODO: Set up test data and dependencies
+
+    # Act
+    # TODO: Execute the code under test
+
+    # Assert
+    # TODO: Verify expected behavior
+    assert True  # Replace with actual assertion"""
+
+_JAVA_STUB_BODY = """
+
+    // Arrange
+    // TODO: Set up test data and dependencies
+
+    // Act
+    // TODO: Execute the code under test
+
+    // Assert
+    // TODO: Verify expected behavior
+    assertTrue(true); // Replace with actual assertion
+}"""
+
+_GENERIC_STUB_BODY = """
+#
+# TODO: Implement test
+# 1. Arrange: Set up test data
+# 2. Act: Execute code under test
+# 3. Assert: Verify expected behavior
+"""
+
+_JUNIT_FILE_IMPORTS = """import org.junit.jupiter.api.Test;
+import static org.junit.jupiter.api.Assertions.*;
+
+"""
+
+# Characters ignored when matching scenario keywords against test names
+_NAME_SEPARATORS = str.maketrans('', '', '_-')
+
+
+def _name_and_description(test_case: Dict[str, Any]) -> Tuple[str, str]:
+    """Return a test case's name and description, defaulting missing keys."""
+    # Generated cases always carry both keys; fall back for hand-built ones
+    try:
+        return test_case['name'], test_case['description']
+    except KeyError:
+        return test_case.get('name', 'test'), test_case.get('description', '')
+
+
+@lru_cache(maxsize=4096)
+def _to_java_method_name(name: str) -> str:
+    """Convert snake_case to camelCase, keeping the first word unchanged."""
+    first, _, rest = name.partition('_')
+    return first + ''.join(map(str.capitalize, rest.split('_')))
 
 
 class TestType(Enum):
@@ -28,7 +98,7 @@ class TestType(Enum):
 class TestGenerator:
     """Generate test cases and test stubs from requirements and code."""
 
-    def __init__(self, framework: TestFramework, language: str):
+    def __init__(self, framework: Framework, language: str):
         """
         Initialize test generator.
 
@@ -55,32 +125,19 @@ class TestGenerator:
         Returns:
             List of test case specifications
         """
-        test_cases = []
-
-        # Generate from user stories
-        if 'user_stories' in requirements:
-            for story in requirements['user_stories']:
-                test_cases.extend(self._test_cases_from_story(story))
-
-        # Generate from acceptance criteria
-        if 'acceptance_criteria' in requirements:
-            for criterion in requirements['acceptance_criteria']:
-                test_cases.extend(self._test_cases_from_criteria(criterion))
+        from_stories = map(self._test_cases_from_story, requirements.get('user_stories', ()))
+        from_criteria = map(self._test_cases_from_criteria, requirements.get('acceptance_criteria', ()))
+        from_api = map(self._test_cases_from_api, requirements.get('api_specs', ()))
 
-        # Generate from API specs
-        if 'api_specs' in requirements:
-            for endpoint in requirements['api_specs']:
-                test_cases.extend(self._test_cases_from_api(endpoint))
+        test_cases = list(chain.from_iterable(chain(from_stories, from_criteria, from_api)))
 
         self.test_cases = test_cases
         return test_cases
 
-    def _test_cases_from_story(self, story: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _test_cases_from_story(self, story: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
         """Generate test cases from user story."""
-        test_cases = []
-
         # Happy path test
-        test_cases.append({
+        yield {
             'name': f"should_{story.get('action', 'work')}_successfully",
             'type': 'happy_path',
             'description': story.get('description', ''),
@@ -88,80 +145,80 @@ class TestGenerator:
             'when': story.get('when', ''),
             'then': story.get('then', ''),
             'priority': 'P0'
-        })
+        }
 
         # Error cases
-        if 'error_conditions' in story:
-            for error in story['error_conditions']:
-                test_cases.append({
-                    'name': f"should_handle_{error.get('condition', 'error')}",
-                    'type': 'error_case',
-                    'description': error.get('description', ''),
-                    'expected_error': error.get('error_type', ''),
-                    'priority': 'P0'
-                })
+        for error in story.get('error_conditions', ()):
+            yield {
+                'name': f"should_handle_{error.get('condition', 'error')}",
+                'type': 'error_case',
+                'description': error.get('description', ''),
+                'expected_error': error.get('error_type', ''),
+                'priority': 'P0'
+            }
 
         # Edge cases
-        if 'edge_cases' in story:
-            for edge_case in story['edge_cases']:
-                test_cases.append({
-                    'name': f"should_handle_{edge_case.get('scenario', 'edge_case')}",
-                    'type': 'edge_case',
-                    'description': edge_case.get('description', ''),
-                    'priority': 'P1'
-                })
-
-        return test_cases
-
-    def _test_cases_from_criteria(self, criterion: Dict[str, Any]) -> List[Dict[str, Any]]:
+        for edge_case in story.get('edge_cases', ()):
+            yield {
+                'name': f"should_handle_{edge_case.get('scenario', 'edge_case')}",
+                'type': 'edge_case',
+                'description': edge_case.get('description', ''),
+                'priority': 'P1'
+            }
+
+    def _test_cases_from_criteria(self, criterion: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
         """Generate test cases from acceptance criteria."""
-        return [{
+        yield {
             'name': f"should_meet_{criterion.get('id', 'criterion')}",
             'type': 'acceptance',
             'description': criterion.get('description', ''),
             'verification': criterion.get('verification_steps', []),
             'priority': 'P0'
-        }]
+        }
 
-    def _test_cases_from_api(self, endpoint: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _test_cases_from_api(self, endpoint: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
         """Generate test cases from API specification."""
-        test_cases = []
         method = endpoint.get('method', 'GET')
         path = endpoint.get('path', '/')
+        success_status = endpoint.get('success_status', 200)
+        has_required_params = 'required_params' in endpoint
+        requires_auth = endpoint.get('requires_auth', False)
+        safe_path = path.replace('/', '_')
 
         # Success case
-        test_cases.append({
-            'name': f"should_{method.lower()}_{path.replace('/', '_')}_successfully",
+        yield {
+            'name': f"should_{method.lower()}_{safe_path}_successfully",
             'type': 'api_success',
+            'description': '',
             'method': method,
             'path': path,
-            'expected_status': endpoint.get('success_status', 200),
+            'expected_status': success_status,
             'priority': 'P0'
-        })
+        }
 
         # Validation errors
-        if 'required_params' in endpoint:
-            test_cases.append({
-                'name': f"should_return_400_for_missing_params",
+        if has_required_params:
+            yield {
+                'name': "should_return_400_for_missing_params",
                 'type': 'api_validation',
+                'description': '',
                 'method': method,
                 'path': path,
                 'expected_status': 400,
                 'priority': 'P0'
-            })
+            }
 
         # Authorization
-        if endpoint.get('requires_auth', False):
-            test_cases.append({
-                'name': f"should_return_401_for_unauthenticated",
+        if requires_auth:
+            yield {
+                'name': "should_return_401_for_unauthenticated",
                 'type': 'api_auth',
+                'description': '',
                 'method': method,
                 'path': path,
                 'expected_status': 401,
                 'priority': 'P0'
-            })
-
-        return test_cases
+            }
 
     def generate_test_stub(self, test_case: Dict[str, Any]) -> str:
         """
@@ -173,128 +230,62 @@ class TestGenerator:
         Returns:
             Test stub code as string
         """
-        if self.framework == TestFramework.JEST:
-            return self._generate_jest_stub(test_case)
-        elif self.framework == TestFramework.PYTEST:
-            return self._generate_pytest_stub(test_case)
-        elif self.framework == TestFramework.JUNIT:
-            return self._generate_junit_stub(test_case)
-        elif self.framework == TestFramework.VITEST:
-            return self._generate_vitest_stub(test_case)
-        else:
+        generator = self._STUB_DISPATCH.get(self.framework)
+        if generator is None:
             return self._generate_generic_stub(test_case)
+        return generator(self, test_case)
 
     def _generate_jest_stub(self, test_case: Dict[str, Any]) -> str:
         """Generate Jest test stub."""
-        name = test_case.get('name', 'test')
-        description = test_case.get('description', '')
+        name, description = _name_and_description(test_case)
 
-        stub = f"""
-describe('{{Feature Name}}', () => {{
-  it('{name}', () => {{
-    // {description}
-
-    // Arrange
-    // TODO: Set up test data and dependencies
-
-    // Act
-    // TODO: Execute the code under test
-
-    // Assert
-    // TODO: Verify expected behavior
-    expect(true).toBe(true); // Replace with actual assertion
-  }});
-}});
-"""
-        return stub.strip()
+        return "".join((
+            "describe('{Feature Name}', () => {\n  it('", name,
+            "', () => {\n    // ", description, "\n", _JS_STUB_BODY
+        ))
 
     def _generate_pytest_stub(self, test_case: Dict[str, Any]) -> str:
         """Generate Pytest test stub."""
-        name = test_case.get('name', 'test')
-        description = test_case.get('description', '')
-
-        stub = f"""
-def test_{name}():
-    \"\"\"
-    {description}
-    \"\"\"
-    # Arrange
-    # TODO: Set up test data and dependencies
+        name, description = _name_and_description(test_case)
 
-    # Act
-    # TODO: Execute the code under test
-
-    # Assert
-    # TODO: Verify expected behavior
-    assert True  # Replace with actual assertion
-"""
-        return stub.strip()
+        return "".join((
+            "def test_", name, "():\n    \"\"\"\n    ", description, _PYTHON_STUB_BODY
+        ))
 
     def _generate_junit_stub(self, test_case: Dict[str, Any]) -> str:
         """Generate JUnit test stub."""
-        name = test_case.get('name', 'test')
-        description = test_case.get('description', '')
+        name, description = _name_and_description(test_case)
 
         # Convert snake_case to camelCase for Java
-        method_name = ''.join(word.capitalize() if i > 0 else word
-                             for i, word in enumerate(name.split('_')))
-
-        stub = f"""
-@Test
-public void {method_name}() {{
-    // {description}
-
-    // Arrange
-    // TODO: Set up test data and dependencies
-
-    // Act
-    // TODO: Execute the code under test
+        method_name = _to_java_method_name(name)
 
-    // Assert
-    // TODO: Verify expected behavior
-    assertTrue(true); // Replace with actual assertion
-}}
-"""
-        return stub.strip()
+        return "".join((
+            "@Test\npublic void ", method_name, "() {\n    // ", description, _JAVA_STUB_BODY
+        ))
 
     def _generate_vitest_stub(self, test_case: Dict[str, Any]) -> str:
         """Generate Vitest test stub (similar to Jest)."""
-        name = test_case.get('name', 'test')
-        description = test_case.get('description', '')
-
-        stub = f"""
-describe('{{Feature Name}}', () => {{
-  it('{name}', () => {{
-    // {description}
-
-    // Arrange
-    // TODO: Set up test data and dependencies
+        name, description = _name_and_description(test_case)
 
-    // Act
-    // TODO: Execute the code under test
-
-    // Assert
-    // TODO: Verify expected behavior
-    expect(true).toBe(true); // Replace with actual assertion
-  }});
-}});
-"""
-        return stub.strip()
+        return "".join((
+            "describe('{Feature Name}', () => {\n  it('", name,
+            "', () => {\n    // ", description, "\n", _JS_STUB_BODY
+        ))
 
     def _generate_generic_stub(self, test_case: Dict[str, Any]) -> str:
         """Generate generic test stub."""
-        name = test_case.get('name', 'test')
-        description = test_case.get('description', '')
+        name, description = _name_and_description(test_case)
 
-        return f"""
-# Test: {name}
-# Description: {description}
-#
-# TODO: Implement test
-# 1. Arrange: Set up test data
-# 2. Act: Execute code under test
-# 3. Assert: Verify expected behavior
-"""
+        return "".join((
+            "\n# Test: ", name, "\n# Description: ", description, _GENERIC_STUB_BODY
+        ))
+
+    _STUB_DISPATCH = {
+        Framework.JEST: _generate_jest_stub,
+        Framework.PYTEST: _generate_pytest_stub,
+        Framework.JUNIT: _generate_junit_stub,
+        Framework.VITEST: _generate_vitest_stub,
+    }
 
     def generate_test_file(
         self,
@@ -313,65 +304,53 @@ describe('{{Feature Name}}', () => {{
         """
         cases = test_cases or self.test_cases
 
-        if self.framework == TestFramework.JEST:
-            return self._generate_jest_file(module_name, cases)
-        elif self.framework == TestFramework.PYTEST:
-            return self._generate_pytest_file(module_name, cases)
-        elif self.framework == TestFramework.JUNIT:
-            return self._generate_junit_file(module_name, cases)
-        elif self.framework == TestFramework.VITEST:
-            return self._generate_vitest_file(module_name, cases)
-        else:
+        generator = self._FILE_DISPATCH.get(self.framework)
+        if generator is None:
             return ""
+        return generator(self, module_name, cases)
 
     def _generate_jest_file(self, module_name: str, test_cases: List[Dict[str, Any]]) -> str:
         """Generate complete Jest test file."""
         imports = f"import {{ {module_name} }} from '../{module_name}';\n\n"
 
-        stubs = []
-        for test_case in test_cases:
-            stubs.append(self._generate_jest_stub(test_case))
+        stubs = map(self._generate_jest_stub, test_cases)
 
-        return imports + "\n\n".join(stubs)
+        return "".join((imports, "\n\n".join(stubs)))
 
     def _generate_pytest_file(self, module_name: str, test_cases: List[Dict[str, Any]]) -> str:
         """Generate complete Pytest test file."""
         imports = f"import pytest\nfrom {module_name} import *\n\n\n"
 
-        stubs = []
-        for test_case in test_cases:
-            stubs.append(self._generate_pytest_stub(test_case))
+        stubs = map(self._generate_pytest_stub, test_cases)
 
-        return imports + "\n\n\n".join(stubs)
+        return "".join((imports, "\n\n\n".join(stubs)))
 
     def _generate_junit_file(self, module_name: str, test_cases: List[Dict[str, Any]]) -> str:
         """Generate complete JUnit test file."""
         class_name = ''.join(word.capitalize() for word in module_name.split('_'))
 
-        imports = """import org.junit.jupiter.api.Test;
-import static org.junit.jupiter.api.Assertions.*;
-
-"""
-
         class_header = f"public class {class_name}Test {{\n\n"
 
-        stubs = []
-        for test_case in test_cases:
-            stubs.append(self._generate_junit_stub(test_case))
+        stubs = map(self._generate_junit_stub, test_cases)
 
         class_footer = "\n}"
 
-        return imports + class_header + "\n\n".join(stubs) + class_footer
+        return "".join((_JUNIT_FILE_IMPORTS, class_header, "\n\n".join(stubs), class_footer))
 
     def _generate_vitest_file(self, module_name: str, test_cases: List[Dict[str, Any]]) -> str:
         """Generate complete Vitest test file."""
         imports = f"import {{ describe, it, expect }} from 'vitest';\nimport {{ {module_name} }} from '../{module_name}';\n\n"
 
-        stubs = []
-        for test_case in test_cases:
-            stubs.append(self._generate_vitest_stub(test_case))
+        stubs = map(self._generate_vitest_stub, test_cases)
+
+        return "".join((imports, "\n\n".join(stubs)))
 
-        return imports + "\n\n".join(stubs)
+    _FILE_DISPATCH = {
+        Framework.JEST: _generate_jest_file,
+        Framework.PYTEST: _generate_pytest_file,
+        Framework.JUNIT: _generate_junit_file,
+        Framework.VITEST: _generate_vitest_file,
+    }
 
     def suggest_missing_scenarios(
         self,
@@ -389,12 +368,17 @@ import static org.junit.jupiter.api.Assertions.*;
             List of suggested test scenarios
         """
         suggestions = []
+        # Normalize existing test names once; the NUL prefix keeps names from
+        # running together and leaves the blob empty only when there are no tests
+        normalized_tests = "".join(
+            "\0" + test.lower().translate(_NAME_SEPARATORS) for test in existing_tests
+        )
 
         # Check for untested error conditions
         if 'error_handlers' in code_analysis:
             for error_handler in code_analysis['error_handlers']:
                 error_name = error_handler.get('type', 'error')
-                if not self._has_test_for(existing_tests, error_name):
+                if not self._has_test_for(normalized_tests, error_name):
                     suggestions.append({
                         'name': f"should_handle_{error_name}",
                         'type': 'error_case',
@@ -406,7 +390,7 @@ import static org.junit.jupiter.api.Assertions.*;
         if 'conditional_branches' in code_analysis:
             for branch in code_analysis['conditional_branches']:
                 branch_name = branch.get('condition', 'condition')
-                if not self._has_test_for(existing_tests, branch_name):
+                if not self._has_test_for(normalized_tests, branch_name):
                     suggestions.append({
                         'name': f"should_test_{branch_name}_branch",
                         'type': 'branch_coverage',
@@ -418,7 +402,7 @@ import static org.junit.jupiter.api.Assertions.*;
         if 'input_validation' in code_analysis:
             for validation in code_analysis['input_validation']:
                 param = validation.get('parameter', 'input')
-                if not self._has_test_for(existing_tests, f"{param}_boundary"):
+                if not self._has_test_for(normalized_tests, f"{param}_boundary"):
                     suggestions.append({
                         'name': f"should_test_{param}_boundary_values",
                         'type': 'boundary',
@@ -428,11 +412,6 @@ import static org.junit.jupiter.api.Assertions.*;
 
         return suggestions
 
-    def _has_test_for(self, existing_tests: List[str], keyword: str) -> bool:
-        """Check if existing tests cover a keyword/scenario."""
-        keyword_lower = keyword.lower().replace('_', '').replace('-', '')
-        for test in existing_tests:
-            test_lower = test.lower().replace('_', '').replace('-', '')
-            if keyword_lower in test_lower:
-                return True
-        return False
+    def _has_test_for(self, normalized_tests: str, keyword: str) -> bool:
+        """Check if existing tests (as normalized by suggest_missing_scenarios) cover a keyword/scenario."""
+        return bool(normalized_tests) and keyword.lower().translate(_NAME_SEPARATORS) in normalized_tests
@@ -9,6 +9,154 @@ from typing import Dict, Any, Optional, Tuple
 import json
 import re
 
+try:
+    from orjson import loads as json_loads
+    HAS_ORJSON = True
+except ImportError:
+    from json import loads as json_loads
+    HAS_ORJSON = False
+
+try:
+    from yaml import CSafeLoader, YAMLError, load as yaml_load
+    HAS_LIBYAML = True
+
+    class _YamlLoader(CSafeLoader):
+        """libyaml safe loader that keeps dates, timestamps and binary values as strings."""
+
+    # Without the timestamp resolver, values like 2024-01-01 load as plain
+    # strings (as the built-in parser returns them), so results stay JSON-safe
+    _YamlLoader.yaml_implicit_resolvers = {
+        first_char: [
+            (tag, pattern) for tag, pattern in resolvers
+            if tag != 'tag:yaml.org,2002:timestamp'
+        ]
+        for first_char, resolvers in CSafeLoader.yaml_implicit_resolvers.items()
+    }
+    # Explicit !!timestamp and !!binary tags would still build date and bytes
+    # objects, so load those as strings too
+    _YamlLoader.add_constructor('tag:yaml.org,2002:timestamp', CSafeLoader.construct_yaml_str)
+    _YamlLoader.add_constructor('tag:yaml.org,2002:binary', CSafeLoader.construct_yaml_str)
+except ImportError:
+    HAS_LIBYAML = False
+
+
+# YAML line indicators, one alternative per kind of line:
+# key-value pairs, list items, trailing colons. [^\S\n] is whitespace other
+# than a newline, so each match stays within one line.
+_YAML_LINE_RE = re.compile(
+    r'(?m)^(?:[^\S\n]*[\w\-]+[^\S\n]*:|[^\S\n]*-[^\S\n]+|:[^\S\n]*$)'
+)
+
+_URL_RE = re.compile(r'https?://[^\s]+')
+
+# Characters one of which must appear for the input to be detected as
+# anything but text: JSON opens with '{' or '[', every YAML line indicator
+# contains ':' or '-', and URLs start with 'h'
+_STRUCTURE_CHARS = frozenset('{[:-h')
+
+# Scalar YAML values
+_BOOLEAN_VALUES = {'true': True, 'yes': True, 'false': False, 'no': False}
+
+# Anything int() or a dotted float() accepts starts with an optional sign
+# followed by a digit or a decimal point
+_NUMBER_START_RE = re.compile(r'[+-]?[\d.]')
+
+# Common technologies, matched as substrings of the lowercased text
+_TECH_KEYWORDS = (
+    'react', 'vue', 'angular', 'svelte', 'next.js', 'nuxt.js',
+    'node.js', 'python', 'java', 'go', 'rust', 'ruby',
+    'postgresql', 'postgres', 'mysql', 'mongodb', 'redis',
+    'aws', 'azure', 'gcp', 'google cloud',
+    'docker', 'kubernetes', 'k8s',
+    'express', 'fastapi', 'django', 'flask', 'spring boot'
+)
+
+# Display names for keywords that str.title() would get wrong
+_TECH_DISPLAY_NAMES = {
+    'postgres': 'PostgreSQL',
+    'next.js': 'Next.js',
+    'nuxt.js': 'Nuxt.js',
+    'node.js': 'Node.js',
+    'k8s': 'Kubernetes',
+    'gcp': 'Google Cloud Platform'
+}
+
+# Keys every normalized result carries
+_STANDARD_KEYS = (
+    'technologies',
+    'use_case',
+    'priorities',
+    'analysis_type',
+    'format'
+)
+
+# Defaults for missing standard keys. 'format' falls back to the detected
+# format instead, and list defaults are copied so results never share them
+_DEFAULTS = {
+    'technologies': [],
+    'use_case': 'general',
+    'priorities': [],
+    'analysis_type': 'comparison'
+}
+
+# Text keyword tables, checked in order against the lowercased input.
+# First match wins for use case and analysis type.
+_USE_CASE_KEYWORDS = {
+    'real-time': 'Real-time application',
+    'collaboration': 'Collaboration platform',
+    'saas': 'SaaS application',
+    'dashboard': 'Dashboard application',
+    'api': 'API-heavy application',
+    'data-intensive': 'Data-intensive application',
+    'e-commerce': 'E-commerce platform',
+    'enterprise': 'Enterprise application'
+}
+
+_PRIORITY_KEYWORDS = {
+    'performance': 'Performance',
+    'scalability': 'Scalability',
+    'developer experience': 'Developer experience',
+    'ecosystem': 'Ecosystem',
+    'learning curve': 'Learning curve',
+    'cost': 'Cost',
+    'security': 'Security',
+    'compliance': 'Compliance'
+}
+
+_ANALYSIS_TYPE_KEYWORDS = {
+    'migration': 'migration_analysis',
+    'migrate': 'migration_analysis',
+    'tco': 'tco_analysis',
+    'total cost': 'tco_analysis',
+    'security': 'security_analysis',
+    'compliance': 'security_analysis',
+    'compare': 'comparison',
+    'vs': 'comparison',
+    'evaluate': 'evaluation'
+}
+
+
+def _first_keyword_match(text: str, keywords: Dict[str, str], default: str) -> str:
+    """
+    Look up the first keyword, in table order, that occurs in text.
+
+    Plain substring tests stop at the first hit, and for short requests
+    they beat a compiled alternation. An alternation would also pick the
+    earliest occurrence in the text rather than the table's priority order.
+
+    Args:
+        text: Lowercase text
+        keywords: Mapping of keyword to result, in priority order
+        default: Result when no keyword occurs
+
+    Returns:
+        Mapped value of the first matching keyword, or default
+    """
+    for keyword, value in keywords.items():
+        if keyword in text:
+            return value
+    return default
+
 
 class FormatDetector:
     """Detect and parse various input formats for stack evaluation."""
@@ -20,9 +168,41 @@ class FormatDetector:
         Args:
             input_data: Raw input string from user
         """
-        self.raw_input = input_data.strip()
+        # Stripped on first access through raw_input
+        self._input_data = input_data
+        self._raw_input = None
+        self.detected_format = None
+        self.parsed_data = None
+        # Result of the JSON probe, shared by detection and parsing
+        self._is_valid_json = None
+        self._json_data = None
+        self._lowered = None
+
+    @property
+    def raw_input(self) -> str:
+        """Input with surrounding whitespace removed."""
+        if self._raw_input is None:
+            self._raw_input = self._input_data.strip()
+        return self._raw_input
+
+    @raw_input.setter
+    def raw_input(self, value: str):
+        # New input invalidates everything derived from the old one
+        self._raw_input = value
         self.detected_format = None
         self.parsed_data = None
+        self._is_valid_json = None
+        self._json_data = None
+        self._lowered = None
+
+    @property
+    def lowered(self) -> str:
+        """Lowercased input, computed once and reused by the text extractors."""
+        if self._lowered is None:
+            # Text with no uppercase characters is its own lowercase form
+            raw = self.raw_input
+            self._lowered = raw if raw.islower() else raw.lower()
+        return self._lowered
 
     def detect_format(self) -> str:
         """
@@ -31,6 +211,11 @@ class FormatDetector:
         Returns:
             Format type: 'json', 'yaml', 'url', 'text'
         """
+        # Plain sentences can't match any structured format; skip the probes
+        if not self.raw_input or _STRUCTURE_CHARS.isdisjoint(self.raw_input):
+            self.detected_format = 'text'
+            return 'text'
+
         # Try JSON first
         if self._is_json():
             self.detected_format = 'json'
@@ -52,11 +237,18 @@ class FormatDetector:
 
     def _is_json(self) -> bool:
         """Check if input is valid JSON."""
-        try:
-            json.loads(self.raw_input)
-            return True
-        except (json.JSONDecodeError, ValueError):
-            return False
+        if self._is_valid_json is None:
+            # Only objects and arrays are usable requests; skip the parse
+            # for anything that cannot start one
+            if self.raw_input[:1] not in ('{', '['):
+                self._is_valid_json = False
+                return False
+            try:
+                self._json_data = json_loads(self.raw_input)
+                self._is_valid_json = True
+            except (json.JSONDecodeError, ValueError):
+                self._is_valid_json = False
+        return self._is_valid_json
 
     def _is_yaml(self) -> bool:
         """
@@ -65,37 +257,19 @@ class FormatDetector:
         Returns:
             True if input appears to be YAML format
         """
-        # YAML indicators
-        yaml_patterns = [
-            r'^\s*[\w\-]+\s*:',  # Key-value pairs
-            r'^\s*-\s+',  # List items
-            r':\s*$',  # Trailing colons
-        ]
-
         # Must not be JSON
         if self._is_json():
             return False
 
-        # Check for YAML patterns
-        lines = self.raw_input.split('\n')
-        yaml_line_count = 0
-
-        for line in lines:
-            for pattern in yaml_patterns:
-                if re.match(pattern, line):
-                    yaml_line_count += 1
-                    break
-
         # If >50% of lines match YAML patterns, consider it YAML
-        if len(lines) > 0 and yaml_line_count / len(lines) > 0.5:
-            return True
+        line_count = self.raw_input.count('\n') + 1
+        yaml_line_count = sum(1 for _ in _YAML_LINE_RE.finditer(self.raw_input))
 
-        return False
+        return yaml_line_count / line_count > 0.5
 
     def _contains_urls(self) -> bool:
         """Check if input contains URLs."""
-        url_pattern = r'https?://[^\s]+'
-        return bool(re.search(url_pattern, self.raw_input))
+        return bool(_URL_RE.search(self.raw_input))
 
     def parse(self) -> Dict[str, Any]:
         """
@@ -120,35 +294,45 @@ class FormatDetector:
 
     def _parse_json(self) -> Dict[str, Any]:
         """Parse JSON input."""
-        try:
-            data = json.loads(self.raw_input)
-            return self._normalize_structure(data)
-        except json.JSONDecodeError:
+        if not self._is_json():
             return {'error': 'Invalid JSON', 'raw': self.raw_input}
+        return self._normalize_structure(self._json_data)
 
     def _parse_yaml(self) -> Dict[str, Any]:
         """
-        Parse YAML-like input (simplified, no external dependencies).
+        Parse YAML-like input.
+
+        Uses PyYAML's libyaml-backed loader when available, otherwise a
+        simplified parser with no external dependencies.
 
         Returns:
             Parsed dictionary
         """
+        if HAS_LIBYAML:
+            try:
+                data = yaml_load(self.raw_input, Loader=_YamlLoader)
+            except YAMLError:
+                data = None
+            if isinstance(data, dict):
+                return self._normalize_structure(data)
+
         result = {}
         current_section = None
         current_list = None
 
-        lines = self.raw_input.split('\n')
+        parse_value = self._parse_value
 
-        for line in lines:
+        for line in self.raw_input.splitlines():
             stripped = line.strip()
-            if not stripped or stripped.startswith('#'):
+            if not stripped or stripped[0] == '#':
                 continue
 
-            # Key-value pair
-            if ':' in stripped:
-                key, value = stripped.split(':', 1)
-                key = key.strip()
-                value = value.strip()
+            # Key-value pair. stripped has no outer whitespace, so each half
+            # only needs trimming on the side next to the colon
+            key, colon, value = stripped.partition(':')
+            if colon:
+                key = key.rstrip()
+                value = value.lstrip()
 
                 # Empty value might indicate nested structure
                 if not value:
@@ -157,18 +341,18 @@ class FormatDetector:
                     current_list = None
                 else:
                     if current_section:
-                        result[current_section][key] = self._parse_value(value)
+                        result[current_section][key] = parse_value(value)
                     else:
-                        result[key] = self._parse_value(value)
+                        result[key] = parse_value(value)
 
             # List item
-            elif stripped.startswith('-'):
-                item = stripped[1:].strip()
+            elif stripped[0] == '-':
+                item = stripped[1:].lstrip()
                 if current_section:
                     if current_list is None:
                         current_list = []
                         result[current_section] = current_list
-                    current_list.append(self._parse_value(item))
+                    current_list.append(parse_value(item))
 
         return self._normalize_structure(result)
 
@@ -185,40 +369,54 @@ class FormatDetector:
         value = value.strip()
 
         # Boolean
-        if value.lower() in ['true', 'yes']:
-            return True
-        if value.lower() in ['false', 'no']:
-            return False
-
-        # Number
-        try:
-            if '.' in value:
-                return float(value)
-            else:
-                return int(value)
-        except ValueError:
-            pass
+        boolean = _BOOLEAN_VALUES.get(value.lower())
+        if boolean is not None:
+            return boolean
+
+        # Number (only attempt the conversion when it can possibly succeed)
+        if _NUMBER_START_RE.match(value):
+            try:
+                if '.' in value:
+                    return float(value)
+                else:
+                    return int(value)
+            except ValueError:
+                pass
 
         # String (remove quotes if present)
-        if value.startswith('"') and value.endswith('"'):
-            return value[1:-1]
-        if value.startswith("'") and value.endswith("'"):
+        if value[:1] in ('"', "'") and value[-1] == value[0]:
             return value[1:-1]
 
         return value
 
     def _parse_urls(self) -> Dict[str, Any]:
         """Parse URLs from input."""
-        url_pattern = r'https?://[^\s]+'
-        urls = re.findall(url_pattern, self.raw_input)
-
-        # Categorize URLs
-        github_urls = [u for u in urls if 'github.com' in u]
-        npm_urls = [u for u in urls if 'npmjs.com' in u or 'npm.io' in u]
-        other_urls = [u for u in urls if u not in github_urls and u not in npm_urls]
+        raw = self.raw_input
+        github_urls = []
+        npm_urls = []
+        other_urls = []
+        context_parts = []
+        pos = 0
+
+        # Categorize URLs and collect the text around them in one scan
+        for match in _URL_RE.finditer(raw):
+            context_parts.append(raw[pos:match.start()])
+            pos = match.end()
+
+            # A URL can match both github and npm; it then goes in both lists
+            url = match.group()
+            is_github = 'github.com' in url
+            is_npm = 'npmjs.com' in url or 'npm.io' in url
+            if is_github:
+                github_urls.append(url)
+            if is_npm:
+                npm_urls.append(url)
+            if not (is_github or is_npm):
+                other_urls.append(url)
+        context_parts.append(raw[pos:])
 
         # Also extract any text context
-        text_without_urls = re.sub(url_pattern, '', self.raw_input).strip()
+        text_without_urls = ''.join(context_parts).strip()
 
         result = {
             'format': 'url',
@@ -234,7 +432,7 @@ class FormatDetector:
 
     def _parse_text(self) -> Dict[str, Any]:
         """Parse conversational text input."""
-        text = self.raw_input.lower()
+        text = self.lowered
 
         # Extract technologies being compared
         technologies = self._extract_technologies(text)
@@ -269,31 +467,12 @@ class FormatDetector:
         Returns:
             List of identified technologies
         """
-        # Common technologies pattern
-        tech_keywords = [
-            'react', 'vue', 'angular', 'svelte', 'next.js', 'nuxt.js',
-            'node.js', 'python', 'java', 'go', 'rust', 'ruby',
-            'postgresql', 'postgres', 'mysql', 'mongodb', 'redis',
-            'aws', 'azure', 'gcp', 'google cloud',
-            'docker', 'kubernetes', 'k8s',
-            'express', 'fastapi', 'django', 'flask', 'spring boot'
-        ]
+        matched = [tech for tech in _TECH_KEYWORDS if tech in text]
 
-        found = []
-        for tech in tech_keywords:
-            if tech in text:
-                # Normalize names
-                normalized = {
-                    'postgres': 'PostgreSQL',
-                    'next.js': 'Next.js',
-                    'nuxt.js': 'Nuxt.js',
-                    'node.js': 'Node.js',
-                    'k8s': 'Kubernetes',
-                    'gcp': 'Google Cloud Platform'
-                }.get(tech, tech.title())
-
-                if normalized not in found:
-                    found.append(normalized)
+        # Normalize names; dict.fromkeys drops duplicates in first-seen order
+        found = list(dict.fromkeys(
+            _TECH_DISPLAY_NAMES.get(tech) or tech.title() for tech in matched
+        ))
 
         return found if found else ['Unknown']
 
@@ -307,22 +486,7 @@ class FormatDetector:
         Returns:
             Use case description
         """
-        use_case_keywords = {
-            'real-time': 'Real-time application',
-            'collaboration': 'Collaboration platform',
-            'saas': 'SaaS application',
-            'dashboard': 'Dashboard application',
-            'api': 'API-heavy application',
-            'data-intensive': 'Data-intensive application',
-            'e-commerce': 'E-commerce platform',
-            'enterprise': 'Enterprise application'
-        }
-
-        for keyword, description in use_case_keywords.items():
-            if keyword in text:
-                return description
-
-        return 'General purpose application'
+        return _first_keyword_match(text, _USE_CASE_KEYWORDS, 'General purpose application')
 
     def _extract_priorities(self, text: str) -> list:
         """
@@ -334,19 +498,8 @@ class FormatDetector:
         Returns:
             List of priorities
         """
-        priority_keywords = {
-            'performance': 'Performance',
-            'scalability': 'Scalability',
-            'developer experience': 'Developer experience',
-            'ecosystem': 'Ecosystem',
-            'learning curve': 'Learning curve',
-            'cost': 'Cost',
-            'security': 'Security',
-            'compliance': 'Compliance'
-        }
-
         priorities = []
-        for keyword, priority in priority_keywords.items():
+        for keyword, priority in _PRIORITY_KEYWORDS.items():
             if keyword in text:
                 priorities.append(priority)
 
@@ -362,56 +515,35 @@ class FormatDetector:
         Returns:
             Analysis type
         """
-        type_keywords = {
-            'migration': 'migration_analysis',
-            'migrate': 'migration_analysis',
-            'tco': 'tco_analysis',
-            'total cost': 'tco_analysis',
-            'security': 'security_analysis',
-            'compliance': 'security_analysis',
-            'compare': 'comparison',
-            'vs': 'comparison',
-            'evaluate': 'evaluation'
-        }
-
-        for keyword, analysis_type in type_keywords.items():
-            if keyword in text:
-                return analysis_type
-
-        return 'comparison'  # Default
+        return _first_keyword_match(text, _ANALYSIS_TYPE_KEYWORDS, 'comparison')
 
     def _normalize_structure(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Normalize parsed data to standard structure.
 
+        Data that already carries every standard key, such as a complete
+        JSON request, is returned as is rather than copied.
+
         Args:
             data: Parsed data dictionary
 
         Returns:
-            Normalized data structure
+            Normalized data structure (data itself when nothing is missing)
         """
         # Ensure standard keys exist
-        standard_keys = [
-            'technologies',
-            'use_case',
-            'priorities',
-            'analysis_type',
-            'format'
-        ]
+        missing = [key for key in _STANDARD_KEYS if key not in data]
+        if not missing:
+            return data
 
         normalized = data.copy()
 
-        for key in standard_keys:
-            if key not in normalized:
-                # Set defaults
-                defaults = {
-                    'technologies': [],
-                    'use_case': 'general',
-                    'priorities': [],
-                    'analysis_type': 'comparison',
-                    'format': self.detected_format or 'unknown'
-                }
-                normalized[key] = defaults.get(key)
+        for key in missing:
+            # Set defaults
+            if key == 'format':
+                normalized[key] = self.detected_format or 'unknown'
+            else:
+                default = _DEFAULTS[key]
+                normalized[key] = default.copy() if isinstance(default, list) else default
 
         return normalized
 
@@ -425,6 +557,6 @@ class FormatDetector:
         return {
             'detected_format': self.detected_format,
             'input_length': len(self.raw_input),
-            'line_count': len(self.raw_input.split('\n')),
+            'line_count': self.raw_input.count('\n') + 1,
             'parsing_successful': self.parsed_data is not None
         }
@@ -5,12 +5,164 @@ Analyzes migration complexity, risks, timelines, and strategies for moving
 from legacy technology stacks to modern alternatives.
 """
 
+from bisect import bisect_right
+from operator import mul
 from typing import Dict, List, Any, Optional, Tuple
 
 
+# Codebase stats assumed when the input leaves them out
+_CODEBASE_DEFAULTS = {
+    'lines_of_code': 10000,
+    'num_components': 50,
+    'architecture_change_level': 'moderate',
+    'has_database': True,
+    'database_size_gb': 10,
+    'schema_changes_required': 'minimal',
+    'data_transformation_required': False,
+    'breaking_api_changes': 'some',
+    'num_dependencies': 20,
+    'dependencies_to_replace': 5,
+    'current_test_coverage': 0.5,  # 0-1 scale
+    'num_tests': 100
+}
+
+# Weights of each complexity factor in the overall score
+_COMPLEXITY_WEIGHTS = {
+    'code_volume': 0.20,
+    'architecture_changes': 0.25,
+    'data_migration': 0.20,
+    'api_compatibility': 0.15,
+    'dependency_changes': 0.10,
+    'testing_requirements': 0.10
+}
+
+# The same weights as a vector in factor order, matching the score dict
+# returned by _compute_factor_scores
+_COMPLEXITY_WEIGHT_VECTOR = tuple(_COMPLEXITY_WEIGHTS.values())
+
+# Banded scores: a value below the first threshold gets the first score,
+# each threshold reached moves one band up
+_CODE_VOLUME_THRESHOLDS = (5000, 20000, 50000, 100000)  # Lines of code
+_CODE_VOLUME_SCORES = (2, 4, 6, 8, 10)
+
+_DATABASE_SIZE_THRESHOLDS = (1, 10, 100, 1000)  # GB
+_DATABASE_SIZE_SCORES = (2, 3, 5, 7, 9)
+
+_REPLACEMENT_PCT_THRESHOLDS = (10, 25, 50, 75)  # Dependencies replaced
+_REPLACEMENT_PCT_SCORES = (2.0, 4.0, 6.0, 8.0, 10.0)
+
+_ARCHITECTURE_SCORES = {
+    'minimal': 2,      # Same patterns, just different framework
+    'moderate': 5,     # Some pattern changes, similar concepts
+    'significant': 7,  # Different patterns, major refactoring
+    'complete': 10     # Complete rewrite, different paradigm
+}
+
+# Data migration score added per level of schema change
+_SCHEMA_ADJUSTMENTS = {
+    'none': 0,
+    'minimal': 1,
+    'moderate': 2,
+    'significant': 3
+}
+
+_API_SCORES = {
+    'none': 1,         # Fully compatible
+    'minimal': 3,      # Few breaking changes
+    'some': 5,         # Moderate breaking changes
+    'many': 7,         # Significant breaking changes
+    'complete': 10     # Complete API rewrite
+}
+
+# Risk severities that count against a migration recommendation
+_HIGH_SEVERITIES = frozenset(('High', 'Critical'))
+
+# Target technology experience levels that make the learning curve a risk
+_LOW_EXPERIENCE_LEVELS = frozenset(('low', 'none'))
+
+# Standard phase percentages
+_PHASE_PERCENTAGES = {
+    'planning_and_prototyping': 0.15,
+    'core_migration': 0.45,
+    'testing_and_validation': 0.25,
+    'deployment_and_monitoring': 0.10,
+    'buffer_and_contingency': 0.05
+}
+
+# (phase, share of hours, display label), formatted once at import
+_PHASE_BREAKDOWN = tuple(
+    (phase, percentage, f"{percentage * 100:.0f}%")
+    for phase, percentage in _PHASE_PERCENTAGES.items()
+)
+
+# Phase descriptions by migration approach; copied into each plan
+_APPROACH_PHASES = {
+    'direct_migration': (
+        'Phase 1: Set up target environment and migrate configuration',
+        'Phase 2: Migrate codebase and dependencies',
+        'Phase 3: Migrate data with validation',
+        'Phase 4: Comprehensive testing',
+        'Phase 5: Cutover and monitoring'
+    ),
+    'phased_migration': (
+        'Phase 1: Identify and prioritize components for migration',
+        'Phase 2: Migrate non-critical components first',
+        'Phase 3: Migrate core components with parallel running',
+        'Phase 4: Migrate critical components with rollback plan',
+        'Phase 5: Decommission old system'
+    ),
+    'strangler_pattern': (
+        'Phase 1: Set up routing layer between old and new systems',
+        'Phase 2: Implement new features in target technology only',
+        'Phase 3: Gradually migrate existing features (lowest risk first)',
+        'Phase 4: Migrate high-risk components last with extensive testing',
+        'Phase 5: Complete migration and remove routing layer'
+    )
+}
+
+_SUCCESS_CRITERIA = (
+    'Feature parity with current system',
+    'Performance equal or better than current system',
+    'Zero data loss or corruption',
+    'All tests passing (unit, integration, E2E)',
+    'Successful production deployment with <1% error rate',
+    'Team trained and comfortable with new technology',
+    'Documentation complete and up-to-date'
+)
+
+
+def _copy_nested(value: Any) -> Any:
+    """
+    Copy the dicts and lists of a cached result so callers can't alter the cache.
+
+    Args:
+        value: Cached result built from dicts, lists and immutable scalars
+
+    Returns:
+        Structurally independent copy; scalars are shared
+    """
+    if isinstance(value, dict):
+        return {key: _copy_nested(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_nested(item) for item in value]
+    return value
+
+
 class MigrationAnalyzer:
     """Analyze migration paths and complexity for technology stack changes."""
 
+    __slots__ = (
+        'source_tech',
+        'target_tech',
+        'codebase_stats',
+        'constraints',
+        'team_info',
+        '_cached_complexity',
+        '_cached_effort',
+        '_cached_risks',
+        '_cached_high_risk_count'
+    )
+
     # Migration complexity factors
     COMPLEXITY_FACTORS = [
         'code_volume',
@@ -34,212 +186,161 @@ class MigrationAnalyzer:
         self.constraints = migration_data.get('constraints', {})
         self.team_info = migration_data.get('team', {})
 
+        # Analysis results, cached because the plan reuses each of them
+        self._cached_complexity = None
+        self._cached_effort = None
+        self._cached_risks = None
+        self._cached_high_risk_count = None
+
+    def invalidate(self) -> None:
+        """
+        Clear cached analysis results.
+
+        Call after any change to codebase_stats, constraints or team_info on an
+        existing instance, whether edited in place or reassigned.
+        """
+        self._cached_complexity = None
+        self._cached_effort = None
+        self._cached_risks = None
+        self._cached_high_risk_count = None
+
     def calculate_complexity_score(self) -> Dict[str, Any]:
         """
         Calculate overall migration complexity (1-10 scale).
 
         Returns:
-            Dictionary with complexity scores by factor
+            Dictionary with complexity scores by factor (a fresh copy on
+            every call, so callers may modify it)
         """
-        scores = {
-            'code_volume': self._score_code_volume(),
-            'architecture_changes': self._score_architecture_changes(),
-            'data_migration': self._score_data_migration(),
-            'api_compatibility': self._score_api_compatibility(),
-            'dependency_changes': self._score_dependency_changes(),
-            'testing_requirements': self._score_testing_requirements()
-        }
+        return dict(self._complexity())
 
-        # Calculate weighted average
-        weights = {
-            'code_volume': 0.20,
-            'architecture_changes': 0.25,
-            'data_migration': 0.20,
-            'api_compatibility': 0.15,
-            'dependency_changes': 0.10,
-            'testing_requirements': 0.10
-        }
+    def _complexity(self) -> Dict[str, float]:
+        """Complexity scores, computed once and shared internally (read-only)."""
+        if self._cached_complexity is not None:
+            return self._cached_complexity
+
+        # Fill in defaults once so the factors can index the stats directly
+        scores = self._compute_factor_scores({**_CODEBASE_DEFAULTS, **self.codebase_stats})
 
-        overall = sum(scores[k] * weights[k] for k in scores.keys())
+        # Calculate weighted average
+        overall = sum(map(mul, scores.values(), _COMPLEXITY_WEIGHT_VECTOR))
         scores['overall_complexity'] = overall
 
+        self._cached_complexity = scores
         return scores
 
-    def _score_code_volume(self) -> float:
+    def _compute_factor_scores(self, stats: Dict[str, Any]) -> Dict[str, float]:
         """
-        Score complexity based on codebase size.
+        Score every complexity factor in one pass over the codebase stats.
+
+        Args:
+            stats: Codebase stats with every key of _CODEBASE_DEFAULTS present
 
         Returns:
-            Code volume complexity score (1-10)
+            Complexity score (1-10) by factor, in COMPLEXITY_FACTORS order
         """
-        lines_of_code = self.codebase_stats.get('lines_of_code', 10000)
-        num_files = self.codebase_stats.get('num_files', 100)
-        num_components = self.codebase_stats.get('num_components', 50)
-
-        # Score based on lines of code (primary factor)
-        if lines_of_code < 5000:
-            base_score = 2
-        elif lines_of_code < 20000:
-            base_score = 4
-        elif lines_of_code < 50000:
-            base_score = 6
-        elif lines_of_code < 100000:
-            base_score = 8
-        else:
-            base_score = 10
+        # Code volume: score based on lines of code (primary factor)
+        lines_of_code = stats['lines_of_code']
+        num_components = stats['num_components']
+
+        code_volume = _CODE_VOLUME_SCORES[
+            bisect_right(_CODE_VOLUME_THRESHOLDS, lines_of_code)
+        ]
 
         # Adjust for component count
         if num_components > 200:
-            base_score = min(10, base_score + 1)
+            code_volume = min(10, code_volume + 1)
         elif num_components > 500:
-            base_score = min(10, base_score + 2)
+            code_volume = min(10, code_volume + 2)
 
-        return float(base_score)
+        # Architecture changes
+        arch_change_level = stats['architecture_change_level']
+        architecture_changes = _ARCHITECTURE_SCORES.get(arch_change_level, 5)
 
-    def _score_architecture_changes(self) -> float:
-        """
-        Score complexity based on architectural changes.
-
-        Returns:
-            Architecture complexity score (1-10)
-        """
-        arch_change_level = self.codebase_stats.get('architecture_change_level', 'moderate')
-
-        scores = {
-            'minimal': 2,      # Same patterns, just different framework
-            'moderate': 5,     # Some pattern changes, similar concepts
-            'significant': 7,  # Different patterns, major refactoring
-            'complete': 10     # Complete rewrite, different paradigm
-        }
-
-        return float(scores.get(arch_change_level, 5))
-
-    def _score_data_migration(self) -> float:
-        """
-        Score complexity based on data migration requirements.
-
-        Returns:
-            Data migration complexity score (1-10)
-        """
-        has_database = self.codebase_stats.get('has_database', True)
-        if not has_database:
-            return 1.0
-
-        database_size_gb = self.codebase_stats.get('database_size_gb', 10)
-        schema_changes = self.codebase_stats.get('schema_changes_required', 'minimal')
-        data_transformation = self.codebase_stats.get('data_transformation_required', False)
-
-        # Base score from database size
-        if database_size_gb < 1:
-            score = 2
-        elif database_size_gb < 10:
-            score = 3
-        elif database_size_gb < 100:
-            score = 5
-        elif database_size_gb < 1000:
-            score = 7
+        # Data migration
+        if not stats['has_database']:
+            data_migration = 1.0
         else:
-            score = 9
-
-        # Adjust for schema changes
-        schema_adjustments = {
-            'none': 0,
-            'minimal': 1,
-            'moderate': 2,
-            'significant': 3
-        }
-        score += schema_adjustments.get(schema_changes, 1)
+            database_size_gb = stats['database_size_gb']
+            schema_changes = stats['schema_changes_required']
+            data_transformation = stats['data_transformation_required']
 
-        # Adjust for data transformation
-        if data_transformation:
-            score += 2
+            # Base score from database size
+            data_migration = _DATABASE_SIZE_SCORES[
+                bisect_right(_DATABASE_SIZE_THRESHOLDS, database_size_gb)
+            ]
 
-        return min(10.0, float(score))
+            # Adjust for schema changes
+            data_migration += _SCHEMA_ADJUSTMENTS.get(schema_changes, 1)
 
-    def _score_api_compatibility(self) -> float:
-        """
-        Score complexity based on API compatibility.
+            # Adjust for data transformation
+            if data_transformation:
+                data_migration += 2
 
-        Returns:
-            API compatibility complexity score (1-10)
-        """
-        breaking_api_changes = self.codebase_stats.get('breaking_api_changes', 'some')
-
-        scores = {
-            'none': 1,         # Fully compatible
-            'minimal': 3,      # Few breaking changes
-            'some': 5,         # Moderate breaking changes
-            'many': 7,         # Significant breaking changes
-            'complete': 10     # Complete API rewrite
-        }
-
-        return float(scores.get(breaking_api_changes, 5))
+            data_migration = min(10.0, float(data_migration))
 
-    def _score_dependency_changes(self) -> float:
-        """
-        Score complexity based on dependency changes.
+        # API compatibility
+        breaking_api_changes = stats['breaking_api_changes']
+        api_compatibility = _API_SCORES.get(breaking_api_changes, 5)
 
-        Returns:
-            Dependency complexity score (1-10)
-        """
-        num_dependencies = self.codebase_stats.get('num_dependencies', 20)
-        dependencies_to_replace = self.codebase_stats.get('dependencies_to_replace', 5)
+        # Dependency changes: score based on replacement percentage
+        num_dependencies = stats['num_dependencies']
+        dependencies_to_replace = stats['dependencies_to_replace']
 
-        # Score based on replacement percentage
         if num_dependencies == 0:
-            return 1.0
-
-        replacement_pct = (dependencies_to_replace / num_dependencies) * 100
-
-        if replacement_pct < 10:
-            return 2.0
-        elif replacement_pct < 25:
-            return 4.0
-        elif replacement_pct < 50:
-            return 6.0
-        elif replacement_pct < 75:
-            return 8.0
+            dependency_changes = 1.0
         else:
-            return 10.0
+            replacement_pct = (dependencies_to_replace / num_dependencies) * 100
+            dependency_changes = _REPLACEMENT_PCT_SCORES[
+                bisect_right(_REPLACEMENT_PCT_THRESHOLDS, replacement_pct)
+            ]
 
-    def _score_testing_requirements(self) -> float:
-        """
-        Score complexity based on testing requirements.
-
-        Returns:
-            Testing complexity score (1-10)
-        """
-        test_coverage = self.codebase_stats.get('current_test_coverage', 0.5)  # 0-1 scale
-        num_tests = self.codebase_stats.get('num_tests', 100)
+        # Testing requirements
+        test_coverage = stats['current_test_coverage']  # 0-1 scale
+        num_tests = stats['num_tests']
 
         # If good test coverage, easier migration (can verify)
         if test_coverage >= 0.8:
-            base_score = 3
+            testing_requirements = 3
         elif test_coverage >= 0.6:
-            base_score = 5
+            testing_requirements = 5
         elif test_coverage >= 0.4:
-            base_score = 7
+            testing_requirements = 7
         else:
-            base_score = 9  # Poor coverage = hard to verify migration
+            testing_requirements = 9  # Poor coverage = hard to verify migration
 
         # Large test suites need updates
         if num_tests > 500:
-            base_score = min(10, base_score + 1)
+            testing_requirements = min(10, testing_requirements + 1)
 
-        return float(base_score)
+        return {
+            'code_volume': float(code_volume),
+            'architecture_changes': float(architecture_changes),
+            'data_migration': data_migration,
+            'api_compatibility': float(api_compatibility),
+            'dependency_changes': dependency_changes,
+            'testing_requirements': float(testing_requirements)
+        }
 
     def estimate_effort(self) -> Dict[str, Any]:
         """
         Estimate migration effort in person-hours and timeline.
 
         Returns:
-            Dictionary with effort estimates
+            Dictionary with effort estimates (a fresh copy on every call)
         """
-        complexity = self.calculate_complexity_score()
+        return _copy_nested(self._effort())
+
+    def _effort(self) -> Dict[str, Any]:
+        """Effort estimate, computed once and shared internally (read-only)."""
+        if self._cached_effort is not None:
+            return self._cached_effort
+
+        complexity = self._complexity()
         overall_complexity = complexity['overall_complexity']
 
         # Base hours estimation
-        lines_of_code = self.codebase_stats.get('lines_of_code', 10000)
+        lines_of_code = self.codebase_stats.get('lines_of_code', _CODEBASE_DEFAULTS['lines_of_code'])
         base_hours = lines_of_code / 50  # 50 lines per hour baseline
 
         # Complexity multiplier
@@ -256,7 +357,7 @@ class MigrationAnalyzer:
         total_dev_weeks = estimated_hours / (team_size * hours_per_week_per_dev)
         total_calendar_weeks = total_dev_weeks * 1.2  # Buffer for blockers
 
-        return {
+        self._cached_effort = {
             'total_hours': estimated_hours,
             'total_person_months': estimated_hours / 160,  # 160 hours per person-month
             'phases': phases,
@@ -270,6 +371,7 @@ class MigrationAnalyzer:
                 'hours_per_week_per_dev': hours_per_week_per_dev
             }
         }
+        return self._cached_effort
 
     def _calculate_phase_breakdown(self, total_hours: float) -> Dict[str, Dict[str, float]]:
         """
@@ -281,22 +383,13 @@ class MigrationAnalyzer:
         Returns:
             Hours breakdown by phase
         """
-        # Standard phase percentages
-        phase_percentages = {
-            'planning_and_prototyping': 0.15,
-            'core_migration': 0.45,
-            'testing_and_validation': 0.25,
-            'deployment_and_monitoring': 0.10,
-            'buffer_and_contingency': 0.05
-        }
-
         phases = {}
-        for phase, percentage in phase_percentages.items():
+        for phase, percentage, label in _PHASE_BREAKDOWN:
             hours = total_hours * percentage
             phases[phase] = {
                 'hours': hours,
                 'person_weeks': hours / 40,
-                'percentage': f"{percentage * 100:.0f}%"
+                'percentage': label
             }
 
         return phases
@@ -306,9 +399,17 @@ class MigrationAnalyzer:
         Identify and assess migration risks.
 
         Returns:
-            Categorized risks with mitigation strategies
+            Categorized risks with mitigation strategies (a fresh copy on
+            every call)
         """
-        complexity = self.calculate_complexity_score()
+        return _copy_nested(self._risks())
+
+    def _risks(self) -> Dict[str, List[Dict[str, str]]]:
+        """Categorized risks, computed once and shared internally (read-only)."""
+        if self._cached_risks is not None:
+            return self._cached_risks
+
+        complexity = self._complexity()
 
         risks = {
             'technical_risks': self._identify_technical_risks(complexity),
@@ -316,6 +417,15 @@ class MigrationAnalyzer:
             'team_risks': self._identify_team_risks()
         }
 
+        # Count high/critical severity risks once, alongside the risks they
+        # are derived from, so the recommendation doesn't rescan them
+        self._cached_high_risk_count = sum(
+            1 for risk_list in risks.values()
+            for risk in risk_list
+            if risk['severity'] in _HIGH_SEVERITIES
+        )
+
+        self._cached_risks = risks
         return risks
 
     def _identify_technical_risks(self, complexity: Dict[str, float]) -> List[Dict[str, str]]:
@@ -416,7 +526,7 @@ class MigrationAnalyzer:
 
         # Learning curve
         team_experience = self.team_info.get('target_tech_experience', 'low')
-        if team_experience in ['low', 'none']:
+        if team_experience in _LOW_EXPERIENCE_LEVELS:
             risks.append({
                 'risk': 'Team lacks experience with target technology',
                 'severity': 'High',
@@ -456,7 +566,9 @@ class MigrationAnalyzer:
         approach = self._recommend_migration_approach(complexity['overall_complexity'])
 
         # Generate recommendation
-        recommendation = self._generate_migration_recommendation(complexity, effort, risks)
+        recommendation = self._generate_migration_recommendation(
+            complexity, effort, self._cached_high_risk_count
+        )
 
         return {
             'source_technology': self.source_tech,
@@ -509,37 +621,13 @@ class MigrationAnalyzer:
         Returns:
             List of phase descriptions
         """
-        phases = {
-            'direct_migration': [
-                'Phase 1: Set up target environment and migrate configuration',
-                'Phase 2: Migrate codebase and dependencies',
-                'Phase 3: Migrate data with validation',
-                'Phase 4: Comprehensive testing',
-                'Phase 5: Cutover and monitoring'
-            ],
-            'phased_migration': [
-                'Phase 1: Identify and prioritize components for migration',
-                'Phase 2: Migrate non-critical components first',
-                'Phase 3: Migrate core components with parallel running',
-                'Phase 4: Migrate critical components with rollback plan',
-                'Phase 5: Decommission old system'
-            ],
-            'strangler_pattern': [
-                'Phase 1: Set up routing layer between old and new systems',
-                'Phase 2: Implement new features in target technology only',
-                'Phase 3: Gradually migrate existing features (lowest risk first)',
-                'Phase 4: Migrate high-risk components last with extensive testing',
-                'Phase 5: Complete migration and remove routing layer'
-            ]
-        }
-
-        return phases.get(approach, phases['phased_migration'])
+        return list(_APPROACH_PHASES.get(approach, _APPROACH_PHASES['phased_migration']))
 
     def _generate_migration_recommendation(
         self,
         complexity: Dict[str, float],
         effort: Dict[str, Any],
-        risks: Dict[str, List[Dict[str, str]]]
+        high_risk_count: int
     ) -> str:
         """
         Generate overall migration recommendation.
@@ -547,7 +635,7 @@ class MigrationAnalyzer:
         Args:
             complexity: Complexity analysis
             effort: Effort estimation
-            risks: Risk assessment
+            high_risk_count: Number of high/critical severity risks
 
         Returns:
             Recommendation string
@@ -555,13 +643,6 @@ class MigrationAnalyzer:
         overall_complexity = complexity['overall_complexity']
         timeline_months = effort['estimated_timeline']['calendar_months']
 
-        # Count high/critical severity risks
-        high_risk_count = sum(
-            1 for risk_list in risks.values()
-            for risk in risk_list
-            if risk['severity'] in ['High', 'Critical']
-        )
-
         if overall_complexity <= 4 and high_risk_count <= 2:
             return f"Recommended - Low complexity migration achievable in {timeline_months:.1f} months with manageable risks"
         elif overall_complexity <= 7 and high_risk_count <= 4:
@@ -576,12 +657,4 @@ class MigrationAnalyzer:
         Returns:
             List of success criteria
         """
-        return [
-            'Feature parity with current system',
-            'Performance equal or better than current system',
-            'Zero data loss or corruption',
-            'All tests passing (unit, integration, E2E)',
-            'Successful production deployment with <1% error rate',
-            'Team trained and comfortable with new technology',
-            'Documentation complete and up-to-date'
-        ]
+        return list(_SUCCESS_CRITERIA)
@@ -5,14 +5,71 @@ Generates reports adapted for Claude Desktop (rich markdown) or CLI (terminal-fr
 with executive summaries and detailed breakdowns on demand.
 """
 
-from typing import Dict, List, Any, Optional
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Any, Iterator, Optional, Tuple
+import io
 import os
-import platform
+
+
+@lru_cache(maxsize=256)
+def _display_name(name: str) -> str:
+    """Title-case a snake_case identifier for display, e.g. 'learning_curve' -> 'Learning Curve'."""
+    return name.replace('_', ' ').title()
+
+
+def _format_cell(value: Any, suffix: str = '') -> str:
+    """Format a numeric matrix cell to one decimal; preformatted strings pass through."""
+    if isinstance(value, str):
+        return value
+    return f"{value:.1f}{suffix}"
+
+
+@lru_cache(maxsize=16)
+def _desktop_matrix_template(tech_names: tuple) -> Tuple[str, str, str]:
+    """
+    Build the markdown matrix header, separator and row format for a set of technologies.
+
+    Args:
+        tech_names: Technology column names, in display order
+
+    Returns:
+        Tuple of (header, separator, row_format); row_format takes the
+        category, weight and one score per technology as positional fields
+    """
+    header = "\n| Category | Weight |" + "".join(f" {tech} |" for tech in tech_names)
+    separator = "\n|----------|--------|" + "--------|" * len(tech_names)
+    row_format = "\n| {} | {} |" + " {} |" * len(tech_names)
+    return header, separator, row_format
 
 
 class ReportGenerator:
     """Generate context-aware technology evaluation reports."""
 
+    # Output context detected from the environment, shared by all instances
+    _detected_context = None
+
+    # Section name -> generator method name
+    _SECTION_METHODS = {
+        'executive_summary': '_section_executive_summary',
+        'comparison_matrix': '_section_comparison_matrix',
+        'tco_analysis': '_section_tco_analysis',
+        'ecosystem_health': '_section_ecosystem_health',
+        'security_assessment': '_section_security_assessment',
+        'migration_analysis': '_section_migration_analysis',
+        'performance_benchmarks': '_section_performance_benchmarks'
+    }
+
+    # Sections rendered from the report_data entry of the same name, in report order
+    _DATA_SECTIONS = (
+        'comparison_matrix',
+        'tco_analysis',
+        'ecosystem_health',
+        'security_assessment',
+        'migration_analysis',
+        'performance_benchmarks'
+    )
+
     def __init__(self, report_data: Dict[str, Any], output_context: Optional[str] = None):
         """
         Initialize report generator.
@@ -23,6 +80,7 @@ class ReportGenerator:
         """
         self.report_data = report_data
         self.output_context = output_context or self._detect_context()
+        self._timestamp = None
 
     def _detect_context(self) -> str:
         """
@@ -31,19 +89,27 @@ class ReportGenerator:
         Returns:
             Context type: 'desktop' or 'cli'
         """
+        # The environment doesn't change within a process; detect it once
+        if ReportGenerator._detected_context is not None:
+            return ReportGenerator._detected_context
+
         # Check for Claude Desktop environment variables or indicators
         # This is a simplified detection - actual implementation would check for
         # Claude Desktop-specific environment variables
 
         if os.getenv('CLAUDE_DESKTOP'):
-            return 'desktop'
+            context = 'desktop'
 
         # Check if running in terminal
-        if os.isatty(1):  # stdout is a terminal
-            return 'cli'
+        elif os.isatty(1):  # stdout is a terminal
+            context = 'cli'
 
         # Default to desktop for rich formatting
-        return 'desktop'
+        else:
+            context = 'desktop'
+
+        ReportGenerator._detected_context = context
+        return context
 
     def generate_executive_summary(self, max_tokens: int = 300) -> str:
         """
@@ -55,49 +121,49 @@ class ReportGenerator:
         Returns:
             Executive summary markdown
         """
-        summary_parts = []
+        summary = io.StringIO()
 
         # Title
         technologies = self.report_data.get('technologies', [])
         tech_names = ', '.join(technologies[:3])  # First 3
-        summary_parts.append(f"# Technology Evaluation: {tech_names}\n")
+        summary.write(f"# Technology Evaluation: {tech_names}\n")
 
         # Recommendation
         recommendation = self.report_data.get('recommendation', {})
         rec_text = recommendation.get('text', 'No recommendation available')
         confidence = recommendation.get('confidence', 0)
 
-        summary_parts.append(f"## Recommendation\n")
-        summary_parts.append(f"**{rec_text}**\n")
-        summary_parts.append(f"*Confidence: {confidence:.0f}%*\n")
+        summary.write(f"## Recommendation\n")
+        summary.write(f"**{rec_text}**\n")
+        summary.write(f"*Confidence: {confidence:.0f}%*\n")
 
         # Top 3 Pros
         pros = recommendation.get('pros', [])[:3]
         if pros:
-            summary_parts.append(f"\n### Top Strengths\n")
+            summary.write(f"\n### Top Strengths\n")
             for pro in pros:
-                summary_parts.append(f"- {pro}\n")
+                summary.write(f"- {pro}\n")
 
         # Top 3 Cons
         cons = recommendation.get('cons', [])[:3]
         if cons:
-            summary_parts.append(f"\n### Key Concerns\n")
+            summary.write(f"\n### Key Concerns\n")
             for con in cons:
-                summary_parts.append(f"- {con}\n")
+                summary.write(f"- {con}\n")
 
         # Key Decision Factors
         decision_factors = self.report_data.get('decision_factors', [])[:3]
         if decision_factors:
-            summary_parts.append(f"\n### Decision Factors\n")
+            summary.write(f"\n### Decision Factors\n")
             for factor in decision_factors:
                 category = factor.get('category', 'Unknown')
                 best = factor.get('best_performer', 'Unknown')
-                summary_parts.append(f"- **{category.replace('_', ' ').title()}**: {best}\n")
+                summary.write(f"- **{_display_name(category)}**: {best}\n")
 
-        summary_parts.append(f"\n---\n")
-        summary_parts.append(f"*For detailed analysis, request full report sections*\n")
+        summary.write(f"\n---\n")
+        summary.write(f"*For detailed analysis, request full report sections*\n")
 
-        return ''.join(summary_parts)
+        return summary.getvalue()
 
     def generate_full_report(self, sections: Optional[List[str]] = None) -> str:
         """
@@ -109,50 +175,47 @@ class ReportGenerator:
         Returns:
             Complete report markdown
         """
+        return '\n\n'.join(self._iter_report_parts(sections))
+
+    def _iter_report_parts(self, sections: Optional[List[str]] = None) -> Iterator[str]:
+        """
+        Yield the report title and each non-empty section in order.
+
+        Args:
+            sections: List of sections to include, or None for all
+
+        Yields:
+            Report parts, to be separated by blank lines
+        """
         if sections is None:
             sections = self._get_available_sections()
 
-        report_parts = []
-
         # Title and metadata
-        report_parts.append(self._generate_title())
+        yield self._generate_title()
 
-        # Generate each requested section
+        # Generate each requested section, skipping data sections with nothing to show
+        report_data = self.report_data
         for section in sections:
+            if section in self._DATA_SECTIONS and not report_data.get(section):
+                continue
             section_content = self._generate_section(section)
             if section_content:
-                report_parts.append(section_content)
-
-        return '\n\n'.join(report_parts)
+                yield section_content
 
     def _get_available_sections(self) -> List[str]:
         """
         Get list of available report sections.
 
+        The executive summary is always included; data sections are listed
+        only when their report data is present and non-empty.
+
         Returns:
             List of section names
         """
-        sections = ['executive_summary']
-
-        if 'comparison_matrix' in self.report_data:
-            sections.append('comparison_matrix')
-
-        if 'tco_analysis' in self.report_data:
-            sections.append('tco_analysis')
-
-        if 'ecosystem_health' in self.report_data:
-            sections.append('ecosystem_health')
-
-        if 'security_assessment' in self.report_data:
-            sections.append('security_assessment')
-
-        if 'migration_analysis' in self.report_data:
-            sections.append('migration_analysis')
-
-        if 'performance_benchmarks' in self.report_data:
-            sections.append('performance_benchmarks')
-
-        return sections
+        report_data = self.report_data
+        return ['executive_summary'] + [
+            section for section in self._DATA_SECTIONS if report_data.get(section)
+        ]
 
     def _generate_title(self) -> str:
         """Generate report title section."""
@@ -191,19 +254,9 @@ Generated: {self._get_timestamp()}
         Returns:
             Section markdown or None
         """
-        generators = {
-            'executive_summary': self._section_executive_summary,
-            'comparison_matrix': self._section_comparison_matrix,
-            'tco_analysis': self._section_tco_analysis,
-            'ecosystem_health': self._section_ecosystem_health,
-            'security_assessment': self._section_security_assessment,
-            'migration_analysis': self._section_migration_analysis,
-            'performance_benchmarks': self._section_performance_benchmarks
-        }
-
-        generator = generators.get(section_name)
-        if generator:
-            return generator()
+        method_name = self._SECTION_METHODS.get(section_name)
+        if method_name:
+            return getattr(self, method_name)()
 
         return None
 
@@ -224,76 +277,74 @@ Generated: {self._get_timestamp()}
 
     def _render_matrix_desktop(self, matrix_data: List[Dict[str, Any]]) -> str:
         """Render comparison matrix for desktop (rich markdown table)."""
-        parts = ["## Comparison Matrix\n"]
-
         if not matrix_data:
             return ""
 
         # Get technology names from first row
         tech_names = list(matrix_data[0].get('scores', {}).keys())
 
-        # Build table header
-        header = "| Category | Weight |"
-        for tech in tech_names:
-            header += f" {tech} |"
-        parts.append(header)
+        header, separator, row_format = _desktop_matrix_template(tuple(tech_names))
 
-        # Separator
-        separator = "|----------|--------|"
-        separator += "--------|" * len(tech_names)
-        parts.append(separator)
+        table = io.StringIO()
+        write = table.write
+        write("## Comparison Matrix\n")
+        write(header)
+        write(separator)
 
         # Rows
         for row in matrix_data:
-            category = row.get('category', '').replace('_', ' ').title()
-            weight = row.get('weight', '')
             scores = row.get('scores', {})
+            write(row_format.format(
+                _display_name(row.get('category', '')),
+                _format_cell(row.get('weight', ''), '%'),
+                *[_format_cell(scores.get(tech, '0.0')) for tech in tech_names]
+            ))
 
-            row_str = f"| {category} | {weight} |"
-            for tech in tech_names:
-                score = scores.get(tech, '0.0')
-                row_str += f" {score} |"
-
-            parts.append(row_str)
-
-        return '\n'.join(parts)
+        return table.getvalue()
 
     def _render_matrix_cli(self, matrix_data: List[Dict[str, Any]]) -> str:
         """Render comparison matrix for CLI (ASCII table)."""
-        parts = ["COMPARISON MATRIX", "=" * 80, ""]
-
         if not matrix_data:
             return ""
 
         # Get technology names
         tech_names = list(matrix_data[0].get('scores', {}).keys())
 
-        # Calculate column widths
-        category_width = 25
-        weight_width = 8
-        score_width = 10
+        # Format every cell once, then size columns to the widest entry
+        rows = []
+        for row in matrix_data:
+            scores = row.get('scores', {})
+            rows.append((
+                _display_name(row.get('category', '')),
+                _format_cell(row.get('weight', ''), '%'),
+                [_format_cell(scores.get(tech, '0.0')) for tech in tech_names]
+            ))
+
+        category_width = max(len('Category'), max(len(r[0]) for r in rows)) + 2
+        weight_width = max(len('Weight'), max(len(r[1]) for r in rows)) + 2
+        score_width = max(
+            [len(tech) for tech in tech_names] +
+            [len(score) for r in rows for score in r[2]],
+            default=0
+        ) + 2
+
+        table = io.StringIO()
+        write = table.write
+        write("COMPARISON MATRIX\n" + "=" * 80 + "\n")
 
         # Header
-        header = f"{'Category':<{category_width}} {'Weight':<{weight_width}}"
+        write(f"\n{'Category':<{category_width}} {'Weight':<{weight_width}}")
         for tech in tech_names:
-            header += f" {tech[:score_width-1]:<{score_width}}"
-        parts.append(header)
-        parts.append("-" * 80)
+            write(f" {tech:<{score_width}}")
+        write("\n" + "-" * 80)
 
         # Rows
-        for row in matrix_data:
-            category = row.get('category', '').replace('_', ' ').title()[:category_width-1]
-            weight = row.get('weight', '')
-            scores = row.get('scores', {})
-
-            row_str = f"{category:<{category_width}} {weight:<{weight_width}}"
-            for tech in tech_names:
-                score = scores.get(tech, '0.0')
-                row_str += f" {score:<{score_width}}"
+        for category, weight, cells in rows:
+            write(f"\n{category:<{category_width}} {weight:<{weight_width}}")
+            for score in cells:
+                write(f" {score:<{score_width}}")
 
-            parts.append(row_str)
-
-        return '\n'.join(parts)
+        return table.getvalue()
 
     def _section_tco_analysis(self) -> str:
         """Generate TCO analysis section."""
@@ -342,7 +393,7 @@ Generated: {self._get_timestamp()}
         parts.append("### Health Metrics")
         for metric, score in scores.items():
             if metric != 'overall_health':
-                metric_name = metric.replace('_', ' ').title()
+                metric_name = _display_name(metric)
                 parts.append(f"- {metric_name}: {score:.1f}/100")
 
         # Viability assessment
@@ -407,7 +458,7 @@ Generated: {self._get_timestamp()}
         # Recommended approach
         approach = migration_data.get('recommended_approach', {})
         if approach:
-            parts.append(f"\n### Recommended Approach: {approach.get('approach', 'Unknown').replace('_', ' ').title()}")
+            parts.append(f"\n### Recommended Approach: {_display_name(approach.get('approach', 'Unknown'))}")
             parts.append(f"{approach.get('description', '')}")
 
         return '\n'.join(parts)
@@ -437,9 +488,10 @@ Generated: {self._get_timestamp()}
         return '\n'.join(parts)
 
     def _get_timestamp(self) -> str:
-        """Get current timestamp."""
-        from datetime import datetime
-        return datetime.now().strftime("%Y-%m-%d %H:%M")
+        """Get report generation timestamp, fixed at first use."""
+        if self._timestamp is None:
+            self._timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+        return self._timestamp
 
     def export_to_file(self, filename: str, sections: Optional[List[str]] = None) -> str:
         """
@@ -452,9 +504,15 @@ Generated: {self._get_timestamp()}
         Returns:
             Path to exported file
         """
-        report = self.generate_full_report(sections)
-
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(report)
+        # Render every section before touching the file, so a failing section
+        # can't leave a truncated report behind; the parts are then written
+        # one by one rather than joined into a second full copy
+        parts = list(self._iter_report_parts(sections))
+
+        with open(filename, 'w', encoding='utf-8', buffering=1 << 16) as f:
+            f.write(parts[0])
+            for part in parts[1:]:
+                f.write('\n\n')
+                f.write(part)
 
         return filename
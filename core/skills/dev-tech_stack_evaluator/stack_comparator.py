@@ -5,10 +5,20 @@ Provides comprehensive technology comparison with customizable weighted criteria
 feature matrices, and intelligent recommendation generation.
 """
 
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
 from typing import Dict, List, Any, Optional, Tuple
+import heapq
 import json
 
 
+@lru_cache(maxsize=256)
+def _readable_name(name: str) -> str:
+    """Spell out a snake_case category name, e.g. 'learning_curve' -> 'learning curve'."""
+    return name.replace('_', ' ')
+
+
 class StackComparator:
     """Main comparison engine for technology stack evaluation."""
 
@@ -36,6 +46,22 @@ class StackComparator:
         "enterprise_readiness": 5
     }
 
+    # Use case specific bonuses/penalties, matched as substrings of the use case
+    USE_CASE_ADJUSTMENTS = {
+        'real-time': {
+            'performance': 1.1,  # 10% bonus for real-time use cases
+            'scalability': 1.1
+        },
+        'enterprise': {
+            'enterprise_readiness': 1.2,  # 20% bonus
+            'documentation': 1.1
+        },
+        'startup': {
+            'developer_experience': 1.15,
+            'learning_curve': 1.1
+        }
+    }
+
     def __init__(self, comparison_data: Dict[str, Any]):
         """
         Initialize comparator with comparison data.
@@ -46,7 +72,12 @@ class StackComparator:
         self.technologies = comparison_data.get('technologies', [])
         self.use_case = comparison_data.get('use_case', 'general')
         self.priorities = comparison_data.get('priorities', {})
+        self._use_case_multipliers = self._resolve_use_case_multipliers()
         self.weights = self._normalize_weights(comparison_data.get('weights', {}))
+        # Weights as decimals, converted once for every weighted score
+        self._weight_fractions = {
+            category: weight / 100.0 for category, weight in self.weights.items()
+        }
         self.scores = {}
 
     def _normalize_weights(self, custom_weights: Dict[str, float]) -> Dict[str, float]:
@@ -59,16 +90,17 @@ class StackComparator:
         Returns:
             Normalized weights dictionary
         """
-        # Start with defaults
-        weights = self.DEFAULT_WEIGHTS.copy()
-
-        # Override with custom weights
-        weights.update(custom_weights)
+        # Start with defaults, overridden with custom weights; the defaults
+        # are only read, so they need no copy when nothing overrides them
+        if custom_weights:
+            weights = {**self.DEFAULT_WEIGHTS, **custom_weights}
+        else:
+            weights = self.DEFAULT_WEIGHTS
 
         # Normalize to 100
         total = sum(weights.values())
         if total == 0:
-            return self.DEFAULT_WEIGHTS
+            return dict(self.DEFAULT_WEIGHTS)
 
         return {k: (v / total) * 100 for k, v in weights.items()}
 
@@ -92,7 +124,11 @@ class StackComparator:
             # Apply use-case specific adjustments
             adjusted_score = self._adjust_for_use_case(category, raw_score, tech_name)
 
-            scores[category] = min(100.0, max(0.0, adjusted_score))
+            # Clamp to 0-100; same results as min(100.0, max(0.0, x)), NaN -> 0.0
+            if 0.0 < adjusted_score < 100.0:
+                scores[category] = adjusted_score
+            else:
+                scores[category] = 100.0 if adjusted_score >= 100.0 else 0.0
 
         return scores
 
@@ -108,37 +144,28 @@ class StackComparator:
         Returns:
             Adjusted score
         """
-        # Use case specific bonuses/penalties
-        adjustments = {
-            'real-time': {
-                'performance': 1.1,  # 10% bonus for real-time use cases
-                'scalability': 1.1
-            },
-            'enterprise': {
-                'enterprise_readiness': 1.2,  # 20% bonus
-                'documentation': 1.1
-            },
-            'startup': {
-                'developer_experience': 1.15,
-                'learning_curve': 1.1
-            }
-        }
+        # Apply adjustment if applicable
+        multiplier = self._use_case_multipliers.get(category)
+        if multiplier is not None:
+            return score * multiplier
+
+        return score
 
-        # Determine use case type
+    def _resolve_use_case_multipliers(self) -> Dict[str, float]:
+        """
+        Resolve the score multipliers for this comparator's use case.
+
+        Returns:
+            Multiplier by feature category; unadjusted categories are absent
+        """
+        # Determine use case type (first match wins)
         use_case_lower = self.use_case.lower()
-        use_case_type = None
 
-        for uc_key in adjustments.keys():
+        for uc_key, multipliers in self.USE_CASE_ADJUSTMENTS.items():
             if uc_key in use_case_lower:
-                use_case_type = uc_key
-                break
+                return multipliers
 
-        # Apply adjustment if applicable
-        if use_case_type and category in adjustments[use_case_type]:
-            multiplier = adjustments[use_case_type][category]
-            return score * multiplier
-
-        return score
+        return {}
 
     def calculate_weighted_score(self, category_scores: Dict[str, float]) -> float:
         """
@@ -151,10 +178,10 @@ class StackComparator:
             Weighted total score (0-100 scale)
         """
         total = 0.0
+        weight_fractions = self._weight_fractions
 
         for category, score in category_scores.items():
-            weight = self.weights.get(category, 0.0) / 100.0  # Convert to decimal
-            total += score * weight
+            total += score * weight_fractions.get(category, 0.0)
 
         return total
 
@@ -182,12 +209,13 @@ class StackComparator:
             tech_name = tech_data.get('name', 'Unknown')
             category_scores = self.score_technology(tech_name, tech_data)
             weighted_score = self.calculate_weighted_score(category_scores)
+            strengths, weaknesses = self._partition_categories(category_scores)
 
             tech_scores[tech_name] = {
                 'category_scores': category_scores,
                 'weighted_total': weighted_score,
-                'strengths': self._identify_strengths(category_scores),
-                'weaknesses': self._identify_weaknesses(category_scores)
+                'strengths': strengths,
+                'weaknesses': weaknesses
             }
 
         results['technologies'] = tech_scores
@@ -199,37 +227,33 @@ class StackComparator:
 
         return results
 
-    def _identify_strengths(self, category_scores: Dict[str, float], threshold: float = 75.0) -> List[str]:
+    def _partition_categories(
+        self,
+        category_scores: Dict[str, float],
+        strength_threshold: float = 75.0,
+        weakness_threshold: float = 50.0
+    ) -> Tuple[List[str], List[str]]:
         """
-        Identify strength categories (scores above threshold).
+        Identify strength and weakness categories in one pass.
 
         Args:
             category_scores: Category scores dictionary
-            threshold: Score threshold for strength identification
+            strength_threshold: Scores at or above this are strengths
+            weakness_threshold: Scores below this are weaknesses
 
         Returns:
-            List of strength categories
+            Tuple of (strength categories, weakness categories)
         """
-        return [
-            category for category, score in category_scores.items()
-            if score >= threshold
-        ]
-
-    def _identify_weaknesses(self, category_scores: Dict[str, float], threshold: float = 50.0) -> List[str]:
-        """
-        Identify weakness categories (scores below threshold).
+        strengths = []
+        weaknesses = []
 
-        Args:
-            category_scores: Category scores dictionary
-            threshold: Score threshold for weakness identification
+        for category, score in category_scores.items():
+            if score >= strength_threshold:
+                strengths.append(category)
+            elif score < weakness_threshold:
+                weaknesses.append(category)
 
-        Returns:
-            List of weakness categories
-        """
-        return [
-            category for category, score in category_scores.items()
-            if score < threshold
-        ]
+        return strengths, weaknesses
 
     def _generate_recommendation(self, tech_scores: Dict[str, Dict[str, Any]]) -> Tuple[str, float]:
         """
@@ -244,15 +268,15 @@ class StackComparator:
         if not tech_scores:
             return "Insufficient data", 0.0
 
-        # Sort by weighted total score
-        sorted_techs = sorted(
+        # Top two by weighted total score (ties keep input order, as with a stable sort)
+        sorted_techs = heapq.nlargest(
+            2,
             tech_scores.items(),
-            key=lambda x: x[1]['weighted_total'],
-            reverse=True
+            key=lambda x: x[1]['weighted_total']
         )
 
-        top_tech = sorted_techs[0][0]
-        top_score = sorted_techs[0][1]['weighted_total']
+        top_tech, top = sorted_techs[0]
+        top_score = top['weighted_total']
 
         # Calculate confidence based on score gap
         if len(sorted_techs) > 1:
@@ -286,22 +310,22 @@ class StackComparator:
         """
         factors = []
 
+        # Resolve each technology's category scores once for all factors
+        tech_items = [(tech, scores['category_scores']) for tech, scores in tech_scores.items()]
+
         # Get top weighted categories
-        sorted_weights = sorted(
+        sorted_weights = heapq.nlargest(
+            3,  # Top 3 factors
             self.weights.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:3]  # Top 3 factors
+            key=lambda x: x[1]
+        )
 
         for category, weight in sorted_weights:
-            # Get scores for this category across all techs
-            category_scores = {
-                tech: scores['category_scores'].get(category, 0.0)
-                for tech, scores in tech_scores.items()
-            }
-
-            # Find best performer
-            best_tech = max(category_scores.items(), key=lambda x: x[1])
+            # Find best performer for this category across all techs
+            best_tech = max(
+                ((tech, category_scores.get(category, 0.0)) for tech, category_scores in tech_items),
+                key=lambda x: x[1]
+            )
 
             factors.append({
                 'category': category,
@@ -316,6 +340,9 @@ class StackComparator:
         """
         Build comparison matrix for display.
 
+        Scores and weights (in percent) are kept as numbers; the report
+        generator formats them when rendering.
+
         Args:
             tech_scores: Technology scores dictionary
 
@@ -324,28 +351,32 @@ class StackComparator:
         """
         matrix = []
 
-        for category in self.FEATURE_CATEGORIES:
-            row = {
-                'category': category,
-                'weight': f"{self.weights.get(category, 0):.1f}%",
-                'scores': {}
-            }
+        categories = self.FEATURE_CATEGORIES
+        weights = self.weights
+        tech_names = list(tech_scores)
 
-            for tech_name, scores in tech_scores.items():
-                category_score = scores['category_scores'].get(category, 0.0)
-                row['scores'][tech_name] = f"{category_score:.1f}"
+        # One itemgetter call per technology pulls every category score
+        # (score_technology fills them all); transpose into per-category rows
+        getter = itemgetter(*categories)
+        columns = [getter(scores['category_scores']) for scores in tech_scores.values()]
+        rows = zip(*columns) if columns else [()] * len(categories)
 
-            matrix.append(row)
+        for category, row_values in zip(categories, rows):
+            matrix.append({
+                'category': category,
+                'weight': weights.get(category, 0),
+                'scores': dict(zip(tech_names, row_values))
+            })
 
         # Add weighted totals row
         totals_row = {
             'category': 'WEIGHTED TOTAL',
-            'weight': '100%',
+            'weight': 100.0,
             'scores': {}
         }
 
         for tech_name, scores in tech_scores.items():
-            totals_row['scores'][tech_name] = f"{scores['weighted_total']:.1f}"
+            totals_row['scores'][tech_name] = scores['weighted_total']
 
         matrix.append(totals_row)
 
@@ -366,18 +397,15 @@ class StackComparator:
         strengths = tech_scores['strengths']
         weaknesses = tech_scores['weaknesses']
 
-        pros = []
-        cons = []
-
-        # Generate pros from strengths
-        for strength in strengths[:3]:  # Top 3
-            score = category_scores[strength]
-            pros.append(f"Excellent {strength.replace('_', ' ')} (score: {score:.1f}/100)")
-
-        # Generate cons from weaknesses
-        for weakness in weaknesses[:3]:  # Top 3
-            score = category_scores[weakness]
-            cons.append(f"Weaker {weakness.replace('_', ' ')} (score: {score:.1f}/100)")
+        # Top 3 strengths and weaknesses, without slicing copies of the lists
+        pros = [
+            f"Excellent {_readable_name(strength)} (score: {category_scores[strength]:.1f}/100)"
+            for strength in islice(strengths, 3)
+        ]
+        cons = [
+            f"Weaker {_readable_name(weakness)} (score: {category_scores[weakness]:.1f}/100)"
+            for weakness in islice(weaknesses, 3)
+        ]
 
         # Add generic pros/cons if not enough specific ones
         if len(pros) == 0:
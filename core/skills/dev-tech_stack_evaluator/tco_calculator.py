@@ -7,11 +7,60 @@ scaling costs, and hidden costs over multi-year projections.
 
 from typing import Dict, List, Any, Optional
 import json
+import math
+
+
+# Share of the migration cost at stake for each vendor lock-in risk level
+_LOCK_IN_RISK_MULTIPLIERS = {
+    'low': 0.1,
+    'medium': 0.3,
+    'high': 0.6
+}
+_DEFAULT_LOCK_IN_MULTIPLIER = 0.2
+
+
+def _copy_nested(value: Any) -> Any:
+    """
+    Copy the dicts and lists in a cached cost result.
+
+    Args:
+        value: Result built from dicts, lists and numbers
+
+    Returns:
+        Copy that shares no containers with the cache
+    """
+    if isinstance(value, dict):
+        return {key: _copy_nested(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_nested(item) for item in value]
+    return value
+
+
+def _money(value: float) -> str:
+    """Format a dollar amount with thousands separators and cents, e.g. '$1,234.50'."""
+    return f"${value:,.2f}"
 
 
 class TCOCalculator:
     """Calculate Total Cost of Ownership for technology stacks."""
 
+    __slots__ = (
+        'technology',
+        'team_size',
+        'timeline_years',
+        'initial_costs',
+        'operational_costs',
+        'scaling_params',
+        'productivity_factors',
+        '_cached_initial',
+        '_cached_operational',
+        '_cached_scaling',
+        '_cached_productivity',
+        '_cached_hidden',
+        '_cached_growth_factors',
+        '_cached_maintenance'
+    )
+
     def __init__(self, tco_data: Dict[str, Any]):
         """
         Initialize TCO calculator with cost parameters.
@@ -27,13 +76,43 @@ class TCOCalculator:
         self.scaling_params = tco_data.get('scaling_params', {})
         self.productivity_factors = tco_data.get('productivity_factors', {})
 
+        # Sub-calculation results, computed on first use
+        self._cached_initial = None
+        self._cached_operational = None
+        self._cached_scaling = None
+        self._cached_productivity = None
+        self._cached_hidden = None
+        self._cached_growth_factors = None
+        self._cached_maintenance = None
+
+    def invalidate(self) -> None:
+        """
+        Clear cached cost calculations.
+
+        Call after changing any cost parameters on an existing instance.
+        """
+        self._cached_initial = None
+        self._cached_operational = None
+        self._cached_scaling = None
+        self._cached_productivity = None
+        self._cached_hidden = None
+        self._cached_growth_factors = None
+        self._cached_maintenance = None
+
     def calculate_initial_costs(self) -> Dict[str, float]:
         """
         Calculate one-time initial costs.
 
         Returns:
-            Dictionary of initial cost components
+            Dictionary of initial cost components (a fresh copy on every call)
         """
+        return dict(self._initial_result())
+
+    def _initial_result(self) -> Dict[str, float]:
+        """Initial costs, computed once and shared internally (read-only)."""
+        if self._cached_initial is not None:
+            return self._cached_initial
+
         costs = {
             'licensing': self.initial_costs.get('licensing', 0.0),
             'training': self._calculate_training_costs(),
@@ -42,7 +121,9 @@ class TCOCalculator:
             'tooling': self.initial_costs.get('tooling', 0.0)
         }
 
-        costs['total_initial'] = sum(costs.values())
+        # Exact summation keeps totals correct across mixed magnitudes
+        costs['total_initial'] = math.fsum(costs.values())
+        self._cached_initial = costs
         return costs
 
     def _calculate_training_costs(self) -> float:
@@ -67,75 +148,92 @@ class TCOCalculator:
         Calculate ongoing operational costs per year.
 
         Returns:
-            Dictionary with yearly cost projections
-        """
-        yearly_costs = {
-            'licensing': [],
-            'hosting': [],
-            'support': [],
-            'maintenance': [],
-            'total_yearly': []
-        }
+            Dictionary with yearly cost projections (a fresh copy on every call)
+        """
+        return _copy_nested(self._operational_result())
 
-        for year in range(1, self.timeline_years + 1):
-            # Licensing costs (may include annual fees)
-            license_cost = self.operational_costs.get('annual_licensing', 0.0)
-            yearly_costs['licensing'].append(license_cost)
+    def _operational_result(self) -> Dict[str, List[float]]:
+        """Yearly operational costs, computed once and shared internally (read-only)."""
+        if self._cached_operational is not None:
+            return self._cached_operational
 
-            # Hosting costs (scale with growth)
-            hosting_cost = self._calculate_hosting_cost(year)
-            yearly_costs['hosting'].append(hosting_cost)
+        years = range(1, self.timeline_years + 1)
 
-            # Support costs
-            support_cost = self.operational_costs.get('annual_support', 0.0)
-            yearly_costs['support'].append(support_cost)
+        # Licensing and support are flat annual fees; maintenance (developer
+        # time) does not vary by year, so each is computed once
+        license_cost = self.operational_costs.get('annual_licensing', 0.0)
+        support_cost = self.operational_costs.get('annual_support', 0.0)
+        maintenance_cost = self._calculate_maintenance_cost(1)
 
-            # Maintenance costs (developer time)
-            maintenance_cost = self._calculate_maintenance_cost(year)
-            yearly_costs['maintenance'].append(maintenance_cost)
+        # Hosting costs (scale with growth)
+        hosting = self._project_hosting_costs(years)
 
-            # Total for year
-            year_total = (
+        self._cached_operational = {
+            'licensing': [license_cost] * len(years),
+            'hosting': hosting,
+            'support': [support_cost] * len(years),
+            'maintenance': [maintenance_cost] * len(years),
+            'total_yearly': [
                 license_cost + hosting_cost + support_cost + maintenance_cost
-            )
-            yearly_costs['total_yearly'].append(year_total)
-
-        return yearly_costs
+                for hosting_cost in hosting
+            ]
+        }
+        return self._cached_operational
 
-    def _calculate_hosting_cost(self, year: int) -> float:
+    def _project_hosting_costs(self, years: range) -> List[float]:
         """
         Calculate hosting costs with growth projection.
 
         Args:
-            year: Year number (1-indexed)
+            years: Year numbers (1-indexed)
 
         Returns:
-            Hosting cost for the year
+            Hosting cost for each year
         """
         base_cost = self.operational_costs.get('monthly_hosting', 1000.0) * 12
-        growth_rate = self.scaling_params.get('annual_growth_rate', 0.20)  # 20% default
+        growth_factors = self._growth_factors()
 
         # Apply compound growth
-        year_cost = base_cost * ((1 + growth_rate) ** (year - 1))
+        return [base_cost * growth_factors[year - 1] for year in years]
 
-        return year_cost
+    def _growth_factors(self) -> List[float]:
+        """
+        Get compound growth factors shared by the hosting, user and server projections.
+
+        Returns:
+            List where index n holds (1 + annual growth rate) ** n, for n = 0..timeline_years.
+            The cached list itself is returned; callers only index or slice it.
+        """
+        if self._cached_growth_factors is None:
+            growth_rate = self.scaling_params.get('annual_growth_rate', 0.20)  # 20% default
+            self._cached_growth_factors = [
+                (1 + growth_rate) ** n for n in range(self.timeline_years + 1)
+            ]
+        return self._cached_growth_factors
 
     def _calculate_maintenance_cost(self, year: int) -> float:
         """
         Calculate maintenance costs (developer time).
 
+        The cost is the same every year, so it is computed once and shared
+        by the operational projection and the technical debt estimate.
+
         Args:
             year: Year number (1-indexed)
 
         Returns:
             Maintenance cost for the year
         """
+        if self._cached_maintenance is not None:
+            return self._cached_maintenance
+
         hours_per_dev_per_month = self.operational_costs.get('maintenance_hours_per_dev_monthly', 20)
         avg_hourly_rate = self.initial_costs.get('developer_hourly_rate', 100)
 
         monthly_cost = self.team_size * hours_per_dev_per_month * avg_hourly_rate
         yearly_cost = monthly_cost * 12
 
+        self._cached_maintenance = yearly_cost
         return yearly_cost
 
     def calculate_scaling_costs(self) -> Dict[str, Any]:
@@ -143,34 +241,38 @@ class TCOCalculator:
         Calculate scaling-related costs and metrics.
 
         Returns:
-            Dictionary with scaling cost analysis
+            Dictionary with scaling cost analysis (a fresh copy on every call)
         """
+        return _copy_nested(self._scaling_result())
+
+    def _scaling_result(self) -> Dict[str, Any]:
+        """Scaling analysis, computed once and shared internally (read-only)."""
+        if self._cached_scaling is not None:
+            return self._cached_scaling
+
         # Project user growth
         initial_users = self.scaling_params.get('initial_users', 1000)
-        annual_growth_rate = self.scaling_params.get('annual_growth_rate', 0.20)
+        growth_factors = self._growth_factors()
 
-        user_projections = []
-        for year in range(1, self.timeline_years + 1):
-            users = initial_users * ((1 + annual_growth_rate) ** year)
-            user_projections.append(int(users))
+        user_projections = [int(initial_users * factor) for factor in growth_factors[1:]]
 
         # Calculate cost per user
-        operational = self.calculate_operational_costs()
-        cost_per_user = []
-
-        for year_idx, year_cost in enumerate(operational['total_yearly']):
-            users = user_projections[year_idx]
-            cost_per_user.append(year_cost / users if users > 0 else 0)
+        operational = self._operational_result()
+        cost_per_user = [
+            year_cost / users if users > 0 else 0
+            for year_cost, users in zip(operational['total_yearly'], user_projections)
+        ]
 
         # Infrastructure scaling costs
         infra_scaling = self._calculate_infrastructure_scaling()
 
-        return {
+        self._cached_scaling = {
             'user_projections': user_projections,
             'cost_per_user': cost_per_user,
             'infrastructure_scaling': infra_scaling,
             'scaling_efficiency': self._calculate_scaling_efficiency(cost_per_user)
         }
+        return self._cached_scaling
 
     def _calculate_infrastructure_scaling(self) -> Dict[str, List[float]]:
         """
@@ -181,13 +283,11 @@ class TCOCalculator:
         """
         base_servers = self.scaling_params.get('initial_servers', 5)
         cost_per_server_monthly = self.scaling_params.get('cost_per_server_monthly', 200)
-        growth_rate = self.scaling_params.get('annual_growth_rate', 0.20)
 
-        server_costs = []
-        for year in range(1, self.timeline_years + 1):
-            servers_needed = base_servers * ((1 + growth_rate) ** year)
-            yearly_cost = servers_needed * cost_per_server_monthly * 12
-            server_costs.append(yearly_cost)
+        server_costs = [
+            base_servers * factor * cost_per_server_monthly * 12
+            for factor in self._growth_factors()[1:]
+        ]
 
         return {
             'yearly_infrastructure_costs': server_costs
@@ -224,8 +324,15 @@ class TCOCalculator:
         Calculate developer productivity impact.
 
         Returns:
-            Productivity analysis
+            Productivity analysis (a fresh copy on every call)
         """
+        return dict(self._productivity_result())
+
+    def _productivity_result(self) -> Dict[str, Any]:
+        """Productivity analysis, computed once and shared internally (read-only)."""
+        if self._cached_productivity is not None:
+            return self._cached_productivity
+
         # Productivity multiplier (1.0 = baseline)
         productivity_multiplier = self.productivity_factors.get('productivity_multiplier', 1.0)
 
@@ -242,30 +349,53 @@ class TCOCalculator:
 
         yearly_productivity_value = additional_features * feature_value
 
-        return {
+        self._cached_productivity = {
             'productivity_multiplier': productivity_multiplier,
             'time_to_market_reduction_days': ttm_reduction,
             'additional_features_per_year': additional_features,
             'yearly_productivity_value': yearly_productivity_value,
             'five_year_productivity_value': yearly_productivity_value * self.timeline_years
         }
+        return self._cached_productivity
 
     def calculate_hidden_costs(self) -> Dict[str, float]:
         """
         Identify and calculate hidden costs.
 
         Returns:
-            Dictionary of hidden cost components
+            Dictionary of hidden cost components (a fresh copy on every call)
         """
+        return dict(self._hidden_result())
+
+    def _hidden_result(self) -> Dict[str, float]:
+        """Hidden costs, computed once and shared internally (read-only)."""
+        if self._cached_hidden is not None:
+            return self._cached_hidden
+
+        factors = self.productivity_factors
+        years = self.timeline_years
+
+        # Security incidents, downtime and turnover all cost a yearly
+        # rate times a unit cost over the timeline
+        incidents_per_year = factors.get('security_incidents_per_year', 0.5)
+        avg_incident_cost = factors.get('avg_security_incident_cost', 50000)
+
+        hours_downtime_per_year = factors.get('downtime_hours_per_year', 2)
+        cost_per_downtime_hour = factors.get('downtime_cost_per_hour', 5000)
+
+        hires_per_year = self.team_size * factors.get('annual_turnover_rate', 0.15)
+        cost_per_hire = factors.get('cost_per_new_hire', 30000)
+
         costs = {
             'technical_debt': self._estimate_technical_debt(),
             'vendor_lock_in_risk': self._estimate_vendor_lock_in_cost(),
-            'security_incidents': self._estimate_security_costs(),
-            'downtime_risk': self._estimate_downtime_costs(),
-            'developer_turnover': self._estimate_turnover_costs()
+            'security_incidents': incidents_per_year * avg_incident_cost * years,
+            'downtime_risk': hours_downtime_per_year * cost_per_downtime_hour * years,
+            'developer_turnover': hires_per_year * cost_per_hire * years
         }
 
-        costs['total_hidden_costs'] = sum(costs.values())
+        costs['total_hidden_costs'] = math.fsum(costs.values())
+        self._cached_hidden = costs
         return costs
 
     def _estimate_technical_debt(self) -> float:
@@ -279,13 +409,13 @@ class TCOCalculator:
         debt_percentage = self.productivity_factors.get('technical_debt_percentage', 0.15)
         yearly_dev_cost = self._calculate_maintenance_cost(1)  # Year 1 baseline
 
-        # Technical debt accumulates over time
-        total_debt_cost = 0
-        for year in range(1, self.timeline_years + 1):
-            year_debt = yearly_dev_cost * debt_percentage * year  # Increases each year
-            total_debt_cost += year_debt
+        # Technical debt accumulates over time: year n costs n times the
+        # yearly debt, so the total is yearly debt * (1 + 2 + ... + T)
+        timeline = self.timeline_years
+        if timeline < 1:
+            return 0
 
-        return total_debt_cost
+        return yearly_dev_cost * debt_percentage * (timeline * (timeline + 1) // 2)
 
     def _estimate_vendor_lock_in_cost(self) -> float:
         """
@@ -299,56 +429,9 @@ class TCOCalculator:
         # Migration cost if switching vendors
         migration_cost = self.initial_costs.get('migration', 10000)
 
-        risk_multipliers = {
-            'low': 0.1,
-            'medium': 0.3,
-            'high': 0.6
-        }
-
-        multiplier = risk_multipliers.get(lock_in_risk, 0.2)
+        multiplier = _LOCK_IN_RISK_MULTIPLIERS.get(lock_in_risk, _DEFAULT_LOCK_IN_MULTIPLIER)
         return migration_cost * multiplier
 
-    def _estimate_security_costs(self) -> float:
-        """
-        Estimate potential security incident costs.
-
-        Returns:
-            Estimated security cost
-        """
-        incidents_per_year = self.productivity_factors.get('security_incidents_per_year', 0.5)
-        avg_incident_cost = self.productivity_factors.get('avg_security_incident_cost', 50000)
-
-        total_cost = incidents_per_year * avg_incident_cost * self.timeline_years
-        return total_cost
-
-    def _estimate_downtime_costs(self) -> float:
-        """
-        Estimate downtime costs.
-
-        Returns:
-            Estimated downtime cost
-        """
-        hours_downtime_per_year = self.productivity_factors.get('downtime_hours_per_year', 2)
-        cost_per_hour = self.productivity_factors.get('downtime_cost_per_hour', 5000)
-
-        total_cost = hours_downtime_per_year * cost_per_hour * self.timeline_years
-        return total_cost
-
-    def _estimate_turnover_costs(self) -> float:
-        """
-        Estimate costs from developer turnover.
-
-        Returns:
-            Estimated turnover cost
-        """
-        turnover_rate = self.productivity_factors.get('annual_turnover_rate', 0.15)
-        cost_per_hire = self.productivity_factors.get('cost_per_new_hire', 30000)
-
-        hires_per_year = self.team_size * turnover_rate
-        total_cost = hires_per_year * cost_per_hire * self.timeline_years
-
-        return total_cost
-
     def calculate_total_tco(self) -> Dict[str, Any]:
         """
         Calculate complete TCO over the timeline.
@@ -363,7 +446,7 @@ class TCOCalculator:
         hidden = self.calculate_hidden_costs()
 
         # Calculate total costs
-        total_operational = sum(operational['total_yearly'])
+        total_operational = math.fsum(operational['total_yearly'])
         total_cost = initial['total_initial'] + total_operational + hidden['total_hidden_costs']
 
         # Adjust for productivity gains
@@ -393,14 +476,47 @@ class TCOCalculator:
 
         return {
             'technology': self.technology,
-            'total_tco': f"${tco['total_tco']:,.2f}",
-            'net_tco': f"${tco['net_tco_after_productivity']:,.2f}",
-            'average_yearly': f"${tco['average_yearly_cost']:,.2f}",
-            'initial_investment': f"${tco['initial_costs']['total_initial']:,.2f}",
+            'total_tco': _money(tco['total_tco']),
+            'net_tco': _money(tco['net_tco_after_productivity']),
+            'average_yearly': _money(tco['average_yearly_cost']),
+            'initial_investment': _money(tco['initial_costs']['total_initial']),
             'key_cost_drivers': self._identify_cost_drivers(tco),
             'cost_optimization_opportunities': self._identify_optimizations(tco)
         }
 
+    @classmethod
+    def evaluate_many(cls, configs: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+        """
+        Calculate TCO for several technology stacks in one call.
+
+        Args:
+            configs: List of tco_data dictionaries, one per stack
+
+        Returns:
+            Column-oriented totals: one list per metric, in config order
+        """
+        columns = {
+            'technology': [],
+            'total_initial': [],
+            'total_operational': [],
+            'total_hidden_costs': [],
+            'total_tco': [],
+            'net_tco_after_productivity': [],
+            'average_yearly_cost': []
+        }
+
+        for config in configs:
+            tco = cls(config).calculate_total_tco()
+            columns['technology'].append(tco['technology'])
+            columns['total_initial'].append(tco['initial_costs']['total_initial'])
+            columns['total_operational'].append(math.fsum(tco['operational_costs']['total_yearly']))
+            columns['total_hidden_costs'].append(tco['hidden_costs']['total_hidden_costs'])
+            columns['total_tco'].append(tco['total_tco'])
+            columns['net_tco_after_productivity'].append(tco['net_tco_after_productivity'])
+            columns['average_yearly_cost'].append(tco['average_yearly_cost'])
+
+        return columns
+
     def _identify_cost_drivers(self, tco: Dict[str, Any]) -> List[str]:
         """
         Identify top cost drivers.
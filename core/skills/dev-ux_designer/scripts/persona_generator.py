@@ -6,12 +6,79 @@ Creates research-backed user personas from user data and interviews
 
 import json
 from typing import Dict, List, Tuple
-from collections import Counter, defaultdict
+from collections import Counter
 import random
 
+# First names and role titles for each persona archetype
+_ARCHETYPE_NAMES = {
+    'power_user': ('Alex', 'Sam', 'Jordan', 'Morgan'),
+    'casual_user': ('Pat', 'Jamie', 'Casey', 'Riley'),
+    'business_user': ('Taylor', 'Cameron', 'Avery', 'Blake'),
+    'mobile_first': ('Quinn', 'Skylar', 'River', 'Sage')
+}
+
+_ARCHETYPE_ROLES = {
+    'power_user': 'the Power User',
+    'casual_user': 'the Casual User',
+    'business_user': 'the Business Professional',
+    'mobile_first': 'the Mobile Native'
+}
+
+def _dedupe_first_n(items: List, n: int) -> List:
+    """Return the first n distinct items, keeping their original order"""
+    unique = []
+    seen = set()
+    for item in items:
+        if item not in seen:
+            seen.add(item)
+            unique.append(item)
+            if len(unique) == n:
+                break
+    return unique
+
 class PersonaGenerator:
     """Generate data-driven personas from user research"""
     
+    # Usage scenarios for each archetype, copied into each persona
+    SCENARIO_TEMPLATES = {
+        'power_user': [
+            {
+                'title': 'Bulk Processing',
+                'context': 'Monday morning, needs to process week\'s data',
+                'goal': 'Complete batch operations quickly',
+                'steps': ['Import data', 'Apply bulk actions', 'Export results'],
+                'pain_points': ['No keyboard shortcuts', 'Slow processing']
+            }
+        ],
+        'casual_user': [
+            {
+                'title': 'Quick Task',
+                'context': 'Needs to complete single task',
+                'goal': 'Get in, complete task, get out',
+                'steps': ['Find feature', 'Complete task', 'Save/Exit'],
+                'pain_points': ['Can\'t find feature', 'Too many steps']
+            }
+        ],
+        'business_user': [
+            {
+                'title': 'Team Collaboration',
+                'context': 'Working with team on project',
+                'goal': 'Share and collaborate efficiently',
+                'steps': ['Create content', 'Share with team', 'Track feedback'],
+                'pain_points': ['No real-time collaboration', 'Poor permission management']
+            }
+        ],
+        'mobile_first': [
+            {
+                'title': 'On-the-Go Access',
+                'context': 'Commuting, needs quick access',
+                'goal': 'Complete task on mobile',
+                'steps': ['Open mobile app', 'Quick action', 'Sync with desktop'],
+                'pain_points': ['Feature parity issues', 'Poor mobile UX']
+            }
+        ]
+    }
+    
     def __init__(self):
         self.persona_components = {
             'demographics': ['age', 'location', 'occupation', 'education', 'income'],
@@ -51,6 +118,20 @@ class PersonaGenerator:
                                   interview_insights: List[Dict] = None) -> Dict:
         """Generate persona from user data and optional interview insights"""
         
+        return self._build_persona(user_data, interview_insights, random)
+    
+    def generate_personas_batch(self, datasets: List[Tuple[List[Dict], List[Dict]]],
+                                seed: int = None) -> List[Dict]:
+        """Generate one persona per (user_data, interview_insights) pair with a shared, seedable RNG"""
+        
+        rng = random.Random(seed)
+        return [self._build_persona(user_data, interview_insights, rng)
+                for user_data, interview_insights in datasets]
+    
+    def _build_persona(self, user_data: List[Dict], interview_insights: List[Dict],
+                       rng: random.Random) -> Dict:
+        """Assemble a persona, drawing the name from the given random generator"""
+        
         # Analyze user data for patterns
         patterns = self._analyze_user_patterns(user_data)
         
@@ -59,12 +140,12 @@ class PersonaGenerator:
         
         # Generate persona
         persona = {
-            'name': self._generate_name(archetype),
+            'name': self._generate_name(archetype, rng),
             'archetype': archetype,
             'tagline': self._generate_tagline(patterns),
-            'demographics': self._aggregate_demographics(user_data),
+            'demographics': self._aggregate_demographics(patterns),
             'psychographics': self._extract_psychographics(patterns, interview_insights),
-            'behaviors': self._analyze_behaviors(user_data),
+            'behaviors': self._analyze_behaviors(patterns),
             'needs_and_goals': self._identify_needs(patterns, interview_insights),
             'frustrations': self._extract_frustrations(patterns, interview_insights),
             'scenarios': self._generate_scenarios(archetype, patterns),
@@ -76,15 +157,19 @@ class PersonaGenerator:
         return persona
     
     def _analyze_user_patterns(self, user_data: List[Dict]) -> Dict:
-        """Analyze patterns in user data"""
+        """Analyze patterns in user data in a single pass over the users"""
         
         patterns = {
-            'usage_frequency': defaultdict(int),
-            'feature_usage': defaultdict(int),
-            'devices': defaultdict(int),
-            'contexts': defaultdict(int),
-            'pain_points': [],
-            'success_metrics': []
+            'user_count': len(user_data),
+            'usage_frequency': Counter(),
+            'feature_usage': Counter(),
+            'devices': Counter(),
+            'contexts': Counter(),
+            'pain_points': Counter(),
+            'success_metrics': [],
+            'ages': [],
+            'locations': Counter(),
+            'tech_scores': []
         }
         
         for user in user_data:
@@ -93,8 +178,7 @@ class PersonaGenerator:
             patterns['usage_frequency'][freq] += 1
             
             # Feature usage
-            for feature in user.get('features_used', []):
-                patterns['feature_usage'][feature] += 1
+            patterns['feature_usage'].update(user.get('features_used', ()))
             
             # Device patterns
             device = user.get('primary_device', 'desktop')
@@ -104,9 +188,17 @@ class PersonaGenerator:
             context = user.get('usage_context', 'work')
             patterns['contexts'][context] += 1
             
-            # Pain points
+            # Pain points (counted as we go for _extract_frustrations)
             if 'pain_points' in user:
-                patterns['pain_points'].extend(user['pain_points'])
+                patterns['pain_points'].update(user['pain_points'])
+            
+            # Demographics, for _aggregate_demographics
+            if 'age' in user:
+                patterns['ages'].append(user['age'])
+            if 'location_type' in user:
+                patterns['locations'][user['location_type']] += 1
+            if 'tech_proficiency' in user:
+                patterns['tech_scores'].append(user['tech_proficiency'])
         
         return patterns
     
@@ -114,8 +206,8 @@ class PersonaGenerator:
         """Identify persona archetype based on patterns"""
         
         # Simple heuristic-based archetype identification
-        freq_pattern = max(patterns['usage_frequency'].items(), key=lambda x: x[1])[0] if patterns['usage_frequency'] else 'medium'
-        device_pattern = max(patterns['devices'].items(), key=lambda x: x[1])[0] if patterns['devices'] else 'desktop'
+        freq_pattern = patterns['usage_frequency'].most_common(1)[0][0] if patterns['usage_frequency'] else 'medium'
+        device_pattern = patterns['devices'].most_common(1)[0][0] if patterns['devices'] else 'desktop'
         
         if freq_pattern == 'daily' and len(patterns['feature_usage']) > 10:
             return 'power_user'
@@ -126,37 +218,23 @@ class PersonaGenerator:
         else:
             return 'casual_user'
     
-    def _generate_name(self, archetype: str) -> str:
+    def _generate_name(self, archetype: str, rng: random.Random = random) -> str:
         """Generate persona name based on archetype"""
         
-        names = {
-            'power_user': ['Alex', 'Sam', 'Jordan', 'Morgan'],
-            'casual_user': ['Pat', 'Jamie', 'Casey', 'Riley'],
-            'business_user': ['Taylor', 'Cameron', 'Avery', 'Blake'],
-            'mobile_first': ['Quinn', 'Skylar', 'River', 'Sage']
-        }
-        
-        name_pool = names.get(archetype, names['casual_user'])
-        first_name = random.choice(name_pool)
-        
-        roles = {
-            'power_user': 'the Power User',
-            'casual_user': 'the Casual User',
-            'business_user': 'the Business Professional',
-            'mobile_first': 'the Mobile Native'
-        }
+        name_pool = _ARCHETYPE_NAMES.get(archetype, _ARCHETYPE_NAMES['casual_user'])
+        first_name = rng.choice(name_pool)
         
-        return f"{first_name} {roles[archetype]}"
+        return f"{first_name} {_ARCHETYPE_ROLES[archetype]}"
     
     def _generate_tagline(self, patterns: Dict) -> str:
         """Generate persona tagline"""
         
-        freq = max(patterns['usage_frequency'].items(), key=lambda x: x[1])[0] if patterns['usage_frequency'] else 'regular'
-        context = max(patterns['contexts'].items(), key=lambda x: x[1])[0] if patterns['contexts'] else 'general'
+        freq = patterns['usage_frequency'].most_common(1)[0][0] if patterns['usage_frequency'] else 'regular'
+        context = patterns['contexts'].most_common(1)[0][0] if patterns['contexts'] else 'general'
         
         return f"A {freq} user who primarily uses the product for {context} purposes"
     
-    def _aggregate_demographics(self, user_data: List[Dict]) -> Dict:
+    def _aggregate_demographics(self, patterns: Dict) -> Dict:
         """Aggregate demographic information"""
         
         demographics = {
@@ -167,11 +245,11 @@ class PersonaGenerator:
             'tech_proficiency': ''
         }
         
-        if not user_data:
+        if not patterns['user_count']:
             return demographics
         
         # Age range
-        ages = [u.get('age', 30) for u in user_data if 'age' in u]
+        ages = patterns['ages']
         if ages:
             avg_age = sum(ages) / len(ages)
             if avg_age < 25:
@@ -184,12 +262,12 @@ class PersonaGenerator:
                 demographics['age_range'] = '45+'
         
         # Location type
-        locations = [u.get('location_type', 'urban') for u in user_data if 'location_type' in u]
+        locations = patterns['locations']
         if locations:
-            demographics['location_type'] = Counter(locations).most_common(1)[0][0]
+            demographics['location_type'] = locations.most_common(1)[0][0]
         
         # Tech proficiency
-        tech_scores = [u.get('tech_proficiency', 5) for u in user_data if 'tech_proficiency' in u]
+        tech_scores = patterns['tech_scores']
         if tech_scores:
             avg_tech = sum(tech_scores) / len(tech_scores)
             if avg_tech < 3:
@@ -228,13 +306,13 @@ class PersonaGenerator:
                 if 'values' in interview:
                     psychographics['values'].extend(interview['values'])
         
-        # Deduplicate
-        psychographics['motivations'] = list(set(psychographics['motivations']))[:5]
-        psychographics['values'] = list(set(psychographics['values']))[:5]
+        # Deduplicate, keeping pattern-derived entries ahead of interview ones
+        psychographics['motivations'] = _dedupe_first_n(psychographics['motivations'], 5)
+        psychographics['values'] = _dedupe_first_n(psychographics['values'], 5)
         
         return psychographics
     
-    def _analyze_behaviors(self, user_data: List[Dict]) -> Dict:
+    def _analyze_behaviors(self, patterns: Dict) -> Dict:
         """Analyze user behaviors"""
         
         behaviors = {
@@ -244,20 +322,15 @@ class PersonaGenerator:
             'learning_preference': ''
         }
         
-        if not user_data:
+        if not patterns['user_count']:
             return behaviors
         
         # Usage patterns
-        frequencies = [u.get('usage_frequency', 'medium') for u in user_data]
-        freq_counter = Counter(frequencies)
+        freq_counter = patterns['usage_frequency']
         behaviors['usage_patterns'] = [f"{freq}: {count} users" for freq, count in freq_counter.most_common(3)]
         
         # Feature preferences
-        all_features = []
-        for user in user_data:
-            all_features.extend(user.get('features_used', []))
-        
-        feature_counter = Counter(all_features)
+        feature_counter = patterns['feature_usage']
         behaviors['feature_preferences'] = [feat for feat, count in feature_counter.most_common(5)]
         
         # Interaction style
@@ -311,8 +384,7 @@ class PersonaGenerator:
         
         # Common frustrations from patterns
         if patterns['pain_points']:
-            frustration_counter = Counter(patterns['pain_points'])
-            frustrations = [pain for pain, count in frustration_counter.most_common(5)]
+            frustrations = [pain for pain, count in patterns['pain_points'].most_common(5)]
         
         # Add archetype-specific frustrations if not enough from data
         if len(frustrations) < 3:
@@ -327,49 +399,17 @@ class PersonaGenerator:
     def _generate_scenarios(self, archetype: str, patterns: Dict) -> List[Dict]:
         """Generate usage scenarios"""
         
-        scenarios = []
-        
-        # Common scenarios based on archetype
-        scenario_templates = {
-            'power_user': [
-                {
-                    'title': 'Bulk Processing',
-                    'context': 'Monday morning, needs to process week\'s data',
-                    'goal': 'Complete batch operations quickly',
-                    'steps': ['Import data', 'Apply bulk actions', 'Export results'],
-                    'pain_points': ['No keyboard shortcuts', 'Slow processing']
-                }
-            ],
-            'casual_user': [
-                {
-                    'title': 'Quick Task',
-                    'context': 'Needs to complete single task',
-                    'goal': 'Get in, complete task, get out',
-                    'steps': ['Find feature', 'Complete task', 'Save/Exit'],
-                    'pain_points': ['Can\'t find feature', 'Too many steps']
-                }
-            ],
-            'business_user': [
-                {
-                    'title': 'Team Collaboration',
-                    'context': 'Working with team on project',
-                    'goal': 'Share and collaborate efficiently',
-                    'steps': ['Create content', 'Share with team', 'Track feedback'],
-                    'pain_points': ['No real-time collaboration', 'Poor permission management']
-                }
-            ],
-            'mobile_first': [
-                {
-                    'title': 'On-the-Go Access',
-                    'context': 'Commuting, needs quick access',
-                    'goal': 'Complete task on mobile',
-                    'steps': ['Open mobile app', 'Quick action', 'Sync with desktop'],
-                    'pain_points': ['Feature parity issues', 'Poor mobile UX']
-                }
-            ]
-        }
+        templates = self.SCENARIO_TEMPLATES.get(archetype, self.SCENARIO_TEMPLATES['casual_user'])
         
-        return scenario_templates.get(archetype, scenario_templates['casual_user'])
+        # Copy so edits to one persona can't reach the shared templates
+        return [
+            {
+                **template,
+                'steps': list(template['steps']),
+                'pain_points': list(template['pain_points'])
+            }
+            for template in templates
+        ]
     
     def _select_quote(self, interviews: List[Dict] = None, archetype: str = 'casual_user') -> str:
         """Select representative quote"""
@@ -462,20 +502,26 @@ class PersonaGenerator:
         
         return "\n".join(output)
 
-def create_sample_user_data():
-    """Create sample user data for testing"""
+def create_sample_user_data(count: int = 30):
+    """Create sample user data for testing (count users, 30 by default)"""
+    frequencies = ['daily', 'weekly', 'monthly']
+    features = ['dashboard', 'reports', 'settings', 'sharing', 'export']
+    devices = ['desktop', 'mobile', 'tablet']
+    contexts = ['work', 'personal']
+    pain_points = ['slow loading', 'confusing UI', 'missing features']
+    
     return [
         {
             'user_id': f'user_{i}',
             'age': 25 + (i % 30),
-            'usage_frequency': ['daily', 'weekly', 'monthly'][i % 3],
-            'features_used': ['dashboard', 'reports', 'settings', 'sharing', 'export'][:3 + (i % 3)],
-            'primary_device': ['desktop', 'mobile', 'tablet'][i % 3],
-            'usage_context': ['work', 'personal'][i % 2],
+            'usage_frequency': frequencies[i % 3],
+            'features_used': features[:3 + (i % 3)],
+            'primary_device': devices[i % 3],
+            'usage_context': contexts[i % 2],
             'tech_proficiency': 3 + (i % 7),
-            'pain_points': ['slow loading', 'confusing UI', 'missing features'][:(i % 3) + 1]
+            'pain_points': pain_points[:(i % 3) + 1]
         }
-        for i in range(30)
+        for i in range(count)
     ]
 
 def main():